@@ -14,24 +14,33 @@ import time
 import random
 import sqlite3
 import hashlib
+import html
+import heapq
 import logging
 import sys
 from collections import OrderedDict
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import signal
+import threading
 import asyncio
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton, Bot
 from telegram.ext import (
     Application, CommandHandler, ContextTypes, 
     CallbackQueryHandler, filters
 )
-from telegram.error import InvalidToken, RetryAfter, TelegramError, TimedOut
+from telegram.error import InvalidToken, NetworkError, RetryAfter, TelegramError, TimedOut
 from telegram.constants import ParseMode
+from telegram.request import HTTPXRequest
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -50,7 +59,7 @@ def env_int(name: str, default: int) -> int:
 
 # Импорт новых модулей (с fallback)
 try:
-    from job_classifier import JobClassifier, get_job_category_info
+    from job_classifier import JobClassifier, get_classifier, get_job_category_info
     CLASSIFIER_AVAILABLE = True
 except ImportError:
     CLASSIFIER_AVAILABLE = False
@@ -108,6 +117,19 @@ except ImportError:
     SOURCE_HEALTH = None
     logging.warning("⚠️ job_sources_extra не найден")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import aiolimiter  # noqa: F401  (backend of telegram.ext.AIORateLimiter)
+    from telegram.ext import AIORateLimiter
+    RATE_LIMITER_AVAILABLE = True
+except ImportError:
+    RATE_LIMITER_AVAILABLE = False
+
 # ==================== CONFIGURATION ====================
 class Config:
     """Application configuration with validation"""
@@ -157,6 +179,10 @@ class Config:
     ENABLE_RSS_SOURCES = os.getenv('ENABLE_RSS_SOURCES', 'true').lower() == 'true'
     # v6.6: skip source after N consecutive hard failures (0 = never skip)
     SOURCE_FAIL_SKIP = env_int('SOURCE_FAIL_SKIP', 3)
+    # Concurrent fetchers: max in-flight requests per host (Apify actors, ATS boards, Adzuna countries)
+    HTTP_PER_HOST_LIMIT = env_int('HTTP_PER_HOST_LIMIT', 4)
+    # Sources fetched at once: bounds how many API responses sit in memory together
+    FETCH_CONCURRENCY = env_int('FETCH_CONCURRENCY', 4)
     TELEGRAM_API_ID = os.getenv('TELEGRAM_API_ID')
     TELEGRAM_API_HASH = os.getenv('TELEGRAM_API_HASH')
     TELEGRAM_SESSION_NAME = os.getenv('TELEGRAM_SESSION_NAME')
@@ -186,6 +212,9 @@ class Config:
     PERSONAL_DIGEST_LOOKBACK_HOURS = env_int('PERSONAL_DIGEST_LOOKBACK_HOURS', 36)
     # v6.3 growth ops
     DEDUP_RETENTION_DAYS = env_int('DEDUP_RETENTION_DAYS', 28)
+    DEDUP_CLEANUP_INTERVAL_HOURS = env_int('DEDUP_CLEANUP_INTERVAL_HOURS', 24)
+    # In-process cache of known posted hashes in front of SQLite (0 = disabled)
+    DEDUP_CACHE_SIZE = env_int('DEDUP_CACHE_SIZE', 50000)
     ENABLE_REALTIME_ALERTS = os.getenv('ENABLE_REALTIME_ALERTS', 'true').lower() == 'true'
     REALTIME_ALERTS_MAX = env_int('REALTIME_ALERTS_MAX', 2)
     REF_REWARD_THRESHOLD = env_int('REF_REWARD_THRESHOLD', 3)
@@ -209,6 +238,13 @@ class Config:
     CHANNEL_ID_DESIGN = os.getenv('CHANNEL_ID_DESIGN', '')
     MULTI_TRACK_MIRROR_MAIN = os.getenv('MULTI_TRACK_MIRROR_MAIN', 'false').lower() == 'true'
     MULTI_TRACK_POST_DELAY = float(os.getenv('MULTI_TRACK_POST_DELAY', '1.0'))
+    # Telegram Bot API limits: ~30 msg/s overall, ~20 msg/min into one group/channel
+    TELEGRAM_GLOBAL_MSGS_PER_SEC = env_int('TELEGRAM_GLOBAL_MSGS_PER_SEC', 30)
+    TELEGRAM_CHAT_MSGS_PER_MIN = env_int('TELEGRAM_CHAT_MSGS_PER_MIN', 20)
+    TELEGRAM_FLOOD_RETRIES = env_int('TELEGRAM_FLOOD_RETRIES', 2)
+    # Serverless Bot keep-alive pool (the long-running Application keeps PTB's 256 default)
+    TELEGRAM_POOL_SIZE = env_int('TELEGRAM_POOL_SIZE', 8)
+    TELEGRAM_POOL_TIMEOUT = env_int('TELEGRAM_POOL_TIMEOUT', 10)
     CHANNEL_ROUTES: list = []  # filled in validate()
     
     @classmethod
@@ -344,14 +380,14 @@ def configure_webshare_proxy() -> Optional[str]:
         params['country_code__in'] = countries
 
     try:
-        response = requests.get(
+        response = HTTP_SESSION.get(
             'https://proxy.webshare.io/api/v2/proxy/list/',
             headers={'Authorization': f'Token {api_key}'},
             params=params,
             timeout=20,
         )
         response.raise_for_status()
-        proxies = response.json().get('results', [])
+        proxies = load_json(response).get('results', [])
         proxy = next((item for item in proxies if item.get('valid')), None) or (proxies[0] if proxies else None)
         if not proxy:
             logger.warning("Webshare proxy list is empty")
@@ -379,45 +415,44 @@ def configure_webshare_proxy() -> Optional[str]:
 
 # ==================== CONSTANTS ====================
 DELAYS = {
-    'between_apis': 5,
-    'random_jitter': 2,
     'after_error': 30,
-    'between_posts': 3
+    # Main loop: transient network failure / locked SQLite vs anything else
+    'after_network_error': 15,
+    'after_db_locked': 10,
+    'after_loop_error': 300,
 }
 if os.getenv('VERCEL'):
     DELAYS.update({
-        'between_apis': 0,
-        'random_jitter': 0,
         'after_error': 5,
-        'between_posts': 1,
     })
 
-USER_AGENTS = [
+USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
-]
+)
 
-JUNIOR_SIGNALS = [
+# Keyword lists are immutable tuples; matching structures are built from them once at load
+JUNIOR_SIGNALS = (
     "junior", "jr", "jr.", "entry level", "entry-level", "entry",
     "trainee", "graduate", "начинающий", "начальный",
     "0-1 year", "0-2 years", "1 year", "1+ year", "1-2 years",
     "no experience", "без опыта", "beginner"
-]
+)
 
-MIDDLE_SIGNALS = [
+MIDDLE_SIGNALS = (
     "middle", "mid-level", "mid level", "intermediate",
     "2-3 years", "2-4 years", "3-5 years", "2+ years", "3+ years"
-]
+)
 
-EXCLUDE_SIGNALS = [
+EXCLUDE_SIGNALS = (
     "senior", "sr.", "sr ", "lead", "principal", "staff engineer",
     "staff", "architect", "head of", "director", "manager", "vp",
     "vice president", "cto", "cfo", "chief", "c-level",
     "старший", "ведущий", "руководитель", "главный"
-]
+)
 
-IT_ROLES = [
+IT_ROLES = (
     "developer", "engineer", "programmer", "designer", "qa", "tester",
     "analyst", "frontend", "backend", "full-stack", "fullstack",
     "devops", "product manager", "data scientist", "data analyst",
@@ -426,9 +461,9 @@ IT_ROLES = [
     "node", "web developer", "software", "support engineer",
     "разработчик", "программист", "инженер", "тестировщик",
     "менеджер проекта", "product owner", "scrum master"
-]
+)
 
-TITLE_IT_SIGNALS = [
+TITLE_IT_SIGNALS = (
     "developer", "engineer", "programmer", "software", "frontend", "front-end",
     "backend", "back-end", "full-stack", "fullstack", "devops", "sre",
     "qa", "tester", "automation", "data scientist", "data analyst",
@@ -437,23 +472,23 @@ TITLE_IT_SIGNALS = [
     "typescript", "java", "php", "ruby", "golang", "node", "web",
     "security", "cloud", "database", "разработчик", "программист",
     "инженер", "тестировщик", "аналитик данных"
-]
+)
 
-NON_IT_TITLE_EXCLUDES = [
+NON_IT_TITLE_EXCLUDES = (
     "assistant", "writer", "content writer", "copywriter", "reviewer",
     "tax", "law", "legal", "accountant", "bookkeeper", "sales",
     "account executive", "customer support", "customer success",
     "recruiter", "talent", "marketing", "seo", "office"
-]
+)
 
-RESUME_BLOCK_SIGNALS = [
+RESUME_BLOCK_SIGNALS = (
     "#резюме", "#resume", "#cv", "резюме", "curriculum vitae",
     "зарплатные ожидания", "salary expectations", "ожидания по зарплате",
     "формат работы:", "о себе:", "ищу работу", "в поиске работы",
     "open to work", "looking for a job", "looking for work",
     "years of experience", "года опыта", "лет опыта", "мой стек",
     "мой опыт", "готов к", "рассматриваю предложения"
-]
+)
 
 SOURCE_PUBLICATION_PRIORITY = {
     "TG": 1,
@@ -478,7 +513,7 @@ SOURCE_PUBLICATION_PRIORITY = {
     "Working Nomads": 13,
 }
 
-REMOTE_KEYWORDS = ["remote", "удаленно", "удалённо", "work from home", "дистанционно", "wfh"]
+REMOTE_KEYWORDS = ("remote", "удаленно", "удалённо", "work from home", "дистанционно", "wfh")
 REMOTE_ONLY_SOURCES = {
     "Remotive",
     "RemoteOK",
@@ -495,7 +530,7 @@ REMOTE_ONLY_SOURCES = {
     "Working Nomads",
 }
 
-TECH_STACK = [
+TECH_STACK = (
     'Python', 'JavaScript', 'TypeScript', 'React', 'Vue', 'Angular',
     'Node.js', 'Django', 'Flask', 'FastAPI', 'Express', 'Next.js',
     'PostgreSQL', 'MongoDB', 'MySQL', 'Redis', 'SQLite',
@@ -504,7 +539,23 @@ TECH_STACK = [
     'HTML', 'CSS', 'SASS', 'Tailwind',
     'Figma', 'Sketch',
     'Java', 'C#', 'Go', 'Rust', 'PHP', 'Ruby', 'Swift', 'Kotlin'
-]
+)
+
+# Common spellings of TECH_STACK entries (matched as whole words, reported canonically)
+TECH_ALIASES = {
+    'golang': 'Go',
+    'html5': 'HTML',
+    'css3': 'CSS',
+    'reactjs': 'React',
+    'react.js': 'React',
+    'nodejs': 'Node.js',
+    'vuejs': 'Vue',
+    'vue.js': 'Vue',
+    'angularjs': 'Angular',
+    'expressjs': 'Express',
+    'nextjs': 'Next.js',
+    'tailwindcss': 'Tailwind',
+}
 
 CATEGORY_NAMES_RU = {
     'development': 'Разработка',
@@ -521,30 +572,75 @@ CATEGORY_NAMES_RU = {
 }
 
 # ==================== DATABASE ====================
+POSTED_JOBS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        hash TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        company TEXT NOT NULL,
+        level TEXT,
+        url TEXT,
+        source TEXT,
+        category TEXT DEFAULT 'other',
+        posted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        fingerprint TEXT DEFAULT ''
+    ) WITHOUT ROWID
+"""
+POSTED_JOBS_COLUMNS = 'hash, title, company, level, url, source, category, posted_at, fingerprint'
+
+
 class DatabaseConnection:
     """Thread-safe SQLite database connection with enhanced schema"""
     def __init__(self, db_path: str = 'jobs.db'):
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # Handlers read from worker threads (asyncio.to_thread); one statement or
+        # transaction() block at a time keeps them off the writer's transaction
+        self._lock = threading.RLock()
+        self._tx_depth = 0
+        # LRU of hashes known to be in posted_jobs -> posted_at, as stored by SQLite
+        self._hash_cache: "OrderedDict[str, str]" = OrderedDict()
+        # posted_jobs row counts by category: one GROUP BY on first use, then kept in step
+        self._category_counts: Optional[Dict[str, int]] = None
+        self._apply_pragmas()
         self._initialize()
+
+    def _apply_pragmas(self):
+        """WAL + NORMAL sync: one fsync per checkpoint instead of two per commit.
+
+        journal_mode=WAL is persistent in the database file; the other pragmas are
+        per connection and applied on every open.
+        """
+        try:
+            mode = self.conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+        except sqlite3.DatabaseError as e:
+            mode = f"error: {e}"
+        # SQLite silently keeps the old mode where WAL can't work (read-only, network FS)
+        self.journal_mode = str(mode).lower()
+        pragmas = [
+            'PRAGMA temp_store=MEMORY',
+            'PRAGMA mmap_size=67108864',
+            'PRAGMA cache_size=-65536',  # 64 MiB page cache
+            'PRAGMA busy_timeout=5000',  # fail fast on a stuck writer; the main loop retries the cycle
+        ]
+        if self.journal_mode == 'wal':
+            pragmas.insert(0, 'PRAGMA synchronous=NORMAL')
+            logger.info("🗄️ SQLite journal_mode=wal, synchronous=NORMAL")
+        else:
+            # NORMAL is only crash-safe with WAL; rollback journals keep the FULL default
+            logger.warning(f"⚠️ SQLite WAL unavailable (journal_mode={mode}), keeping synchronous=FULL")
+        for pragma in pragmas:
+            try:
+                self.conn.execute(pragma)
+            except sqlite3.DatabaseError as e:
+                # e.g. read-only or network filesystems without shared-memory support
+                logger.warning(f"{pragma} failed: {e}")
     
     def _initialize(self):
         """Initialize database schema with migrations"""
         c = self.conn.cursor()
         
-        # Main jobs table
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS posted_jobs (
-                hash TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                company TEXT NOT NULL,
-                level TEXT,
-                url TEXT,
-                source TEXT,
-                category TEXT DEFAULT 'other',
-                posted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        # Main jobs table (clustered on hash: dedup lookups hit the table b-tree directly)
+        c.execute(POSTED_JOBS_SCHEMA.format(name='posted_jobs'))
         
         # User favorites
         c.execute("""
@@ -610,8 +706,6 @@ class DatabaseConnection:
         """)
         
         # Indexes
-        c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_category ON posted_jobs(category)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_posted_at ON posted_jobs(posted_at)")
         c.execute("CREATE INDEX IF NOT EXISTS idx_favorites_user ON user_favorites(user_id)")
         c.execute("CREATE INDEX IF NOT EXISTS idx_tg_hashes_created ON telegram_content_hashes(created_at)")
         c.execute("CREATE INDEX IF NOT EXISTS idx_events_name_ts ON events(name, ts)")
@@ -639,7 +733,12 @@ class DatabaseConnection:
             c.execute("SELECT fingerprint FROM posted_jobs LIMIT 1")
         except sqlite3.OperationalError:
             c.execute("ALTER TABLE posted_jobs ADD COLUMN fingerprint TEXT DEFAULT ''")
-            c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_fingerprint ON posted_jobs(fingerprint)")
+
+        # Migration: rebuild legacy rowid posted_jobs as WITHOUT ROWID
+        self._rebuild_posted_jobs_without_rowid(c)
+        c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_category ON posted_jobs(category)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_posted_at ON posted_jobs(posted_at)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_fingerprint ON posted_jobs(fingerprint)")
 
         # Migration: profile columns on user_settings
         for col, decl in (
@@ -656,28 +755,83 @@ class DatabaseConnection:
         
         self.conn.commit()
         logger.info("✅ Database initialized")
+
+    def _rebuild_posted_jobs_without_rowid(self, c: "sqlite3.Cursor") -> None:
+        """Copy a pre-WITHOUT-ROWID posted_jobs into the current schema (one-off)."""
+        c.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'posted_jobs'")
+        row = c.fetchone()
+        if not row or 'WITHOUT ROWID' in (row[0] or '').upper():
+            return
+        c.execute("DROP TABLE IF EXISTS posted_jobs_new")
+        c.execute(POSTED_JOBS_SCHEMA.format(name='posted_jobs_new'))
+        c.execute(
+            f"INSERT OR IGNORE INTO posted_jobs_new ({POSTED_JOBS_COLUMNS}) "
+            f"SELECT {POSTED_JOBS_COLUMNS} FROM posted_jobs ORDER BY rowid"
+        )
+        c.execute("DROP TABLE posted_jobs")
+        c.execute("ALTER TABLE posted_jobs_new RENAME TO posted_jobs")
+        c.execute("ANALYZE posted_jobs")
+        logger.info("🗄️ posted_jobs rebuilt as WITHOUT ROWID")
     
+    @contextmanager
+    def transaction(self):
+        """Group writes into one BEGIN IMMEDIATE … COMMIT; nested blocks join the outer one."""
+        with self._lock:
+            if self._tx_depth == 0 and not self.conn.in_transaction:
+                self.conn.execute('BEGIN IMMEDIATE')
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.conn.rollback()
+                raise
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self.conn.commit()
+
+    def commit(self):
+        """Commit unless inside transaction() — the outermost block commits then."""
+        if self._tx_depth == 0:
+            self.conn.commit()
+
     def execute(self, query: str, params: tuple = ())->"sqlite3.Cursor":
-        """Execute query with commit"""
-        cursor = self.conn.cursor()
-        cursor.execute(query, params)
-        self.conn.commit()
-        return cursor
+        """Execute query with commit (deferred while inside transaction())"""
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
+            self.commit()
+            return cursor
+
+    def executemany(self, query: str, seq_of_params) -> "sqlite3.Cursor":
+        """Execute query for every params tuple, single commit"""
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.executemany(query, seq_of_params)
+            self.commit()
+            return cursor
     
     def fetchone(self, query: str, params: tuple = ()):
         """Execute query and fetch one row"""
-        cursor = self.conn.cursor()
-        cursor.execute(query, params)
-        return cursor.fetchone()
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
+            return cursor.fetchone()
     
     def fetchall(self, query: str, params: tuple = ()):
         """Execute query and fetch all rows"""
-        cursor = self.conn.cursor()
-        cursor.execute(query, params)
-        return cursor.fetchall()
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
+            return cursor.fetchall()
     
     def close(self):
         """Close database connection"""
+        try:
+            self.conn.execute('PRAGMA optimize')  # refresh planner stats where they drifted
+        except sqlite3.Error:
+            pass
         self.conn.close()
         logger.info("🔌 Database connection closed")
     
@@ -844,14 +998,14 @@ class DatabaseConnection:
         if not job_hash:
             return
         try:
-            payload = serialize_job_payload(job) if GROWTH_UTILS_AVAILABLE else job
+            if GROWTH_UTILS_AVAILABLE:
+                payload = serialize_job_payload(job)
+            else:
+                payload = {k: v for k, v in job.items() if not str(k).startswith('_')}
             self.execute(
                 'INSERT OR REPLACE INTO job_payloads (hash, payload, created_at) VALUES (?, ?, CURRENT_TIMESTAMP)',
                 (job_hash, _json.dumps(payload, ensure_ascii=False)),
             )
-            # prune old payloads (>14 days)
-            cutoff = datetime.now() - timedelta(days=14)
-            self.execute('DELETE FROM job_payloads WHERE created_at < ?', (cutoff,))
         except Exception as e:
             logger.debug(f"save_job_payload failed: {e}")
 
@@ -1065,6 +1219,117 @@ class DatabaseConnection:
         )
         return [r[0] for r in rows if r and r[0]]
 
+    def remember_hashes(self, rows) -> None:
+        """Add (hash, posted_at) pairs to the in-memory cache, evicting least recently used."""
+        cache = self._hash_cache
+        limit = Config.DEDUP_CACHE_SIZE
+        if limit <= 0:
+            return
+        for job_hash, posted_at in rows:
+            cache[job_hash] = str(posted_at)
+            cache.move_to_end(job_hash)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+    def warm_hash_cache(self) -> int:
+        """Preload the most recently posted hashes so early cycles skip SQLite for repeats."""
+        limit = Config.DEDUP_CACHE_SIZE
+        if limit <= 0:
+            return 0
+        rows = self.fetchall(
+            'SELECT hash, posted_at FROM posted_jobs ORDER BY posted_at DESC LIMIT ?', (limit,)
+        )
+        # Oldest first, so the newest hashes end up as most recently used
+        self.remember_hashes(reversed(rows))
+        return len(rows)
+
+    def reset_hash_cache(self) -> None:
+        self._hash_cache.clear()
+        self._category_counts = None
+
+    def posted_counts_by_category(self) -> Dict[str, int]:
+        """posted_jobs counts per category without rescanning the table on every /status.
+
+        Safe to call from a worker thread: writers adjust the counts inside their
+        transaction() block, so the first GROUP BY never sees a half-applied insert.
+        """
+        with self._lock:
+            if self._category_counts is None:
+                rows = self.fetchall('SELECT category, COUNT(*) FROM posted_jobs GROUP BY category')
+                self._category_counts = {category: count for category, count in rows}
+            return dict(self._category_counts)
+
+    def adjust_category_counts(self, deltas: Dict[str, int]) -> None:
+        with self._lock:
+            if self._category_counts is None:
+                return  # not loaded yet: the first read counts from the table anyway
+            for category, delta in deltas.items():
+                count = self._category_counts.get(category, 0) + delta
+                if count > 0:
+                    self._category_counts[category] = count
+                else:
+                    self._category_counts.pop(category, None)
+
+    def get_existing_hashes(self, hashes: List[str], chunk_size: int = 500) -> set:
+        """Return the subset of hashes already in posted_jobs.
+
+        Cached hashes are answered from memory; only misses go to SQLite (one IN query per chunk).
+        """
+        cache = self._hash_cache
+        existing = set()
+        misses = []
+        for h in dict.fromkeys(h for h in hashes if h):
+            if h in cache:
+                cache.move_to_end(h)
+                existing.add(h)
+            else:
+                misses.append(h)
+        for i in range(0, len(misses), chunk_size):
+            chunk = misses[i:i + chunk_size]
+            rows = self.fetchall(
+                f'SELECT hash, posted_at FROM posted_jobs WHERE hash IN ({",".join("?" * len(chunk))})',
+                tuple(chunk),
+            )
+            existing.update(r[0] for r in rows)
+            self.remember_hashes(rows)
+        return existing
+
+    def purge_expired(self, retention_days: int, payload_days: int = 14) -> bool:
+        """Drop dedup rows and cached payloads past retention (daily, not per job).
+
+        Returns False when the purge failed (e.g. the database stayed locked), so the
+        caller can retry on the next cycle.
+        """
+        now = datetime.now()
+        cutoff = now - timedelta(days=retention_days)
+        try:
+            with self.transaction():
+                expired = {}
+                if self._category_counts is not None:
+                    expired = dict(self.fetchall(
+                        'SELECT category, COUNT(*) FROM posted_jobs WHERE posted_at < ? GROUP BY category',
+                        (cutoff,),
+                    ))
+                self.execute('DELETE FROM posted_jobs WHERE posted_at < ?', (cutoff,))
+                self.execute('DELETE FROM job_payloads WHERE created_at < ?', (now - timedelta(days=payload_days),))
+                # Under the same lock as the DELETE, so /status never counts from a half-done purge
+                self.adjust_category_counts({category: -count for category, count in expired.items()})
+                # Same text comparison SQLite just did, so cached hashes expire with their rows
+                cutoff_text = str(cutoff)
+                for job_hash in [h for h, posted_at in self._hash_cache.items() if posted_at < cutoff_text]:
+                    del self._hash_cache[job_hash]
+        except Exception as e:
+            logger.warning(f"purge_expired failed: {e}")
+            return False
+        return True
+
+
+def is_sqlite_busy(error: BaseException) -> bool:
+    """True for "database is locked/busy" errors raised once busy_timeout runs out."""
+    return isinstance(error, sqlite3.OperationalError) and any(
+        word in str(error).lower() for word in ('locked', 'busy')
+    )
+
 
 def init_database() -> DatabaseConnection:
     """Initialize and return database connection"""
@@ -1082,11 +1347,20 @@ def normalize_url(url: str) -> str:
     return urlunsplit((p.scheme, p.netloc, p.path, '', ''))
 
 
+def url_hash(normalized_url: str) -> str:
+    """Dedup key for a normalized URL.
+
+    The format is persisted (posted_jobs, favorites, payloads) and embedded in inline
+    buttons of already published posts, so it must stay stable across releases.
+    """
+    return hashlib.sha256(normalized_url.encode()).hexdigest()[:16]
+
+
 def generate_job_hash(job: Dict) -> str:
     """Generate robust hash using normalized URL (primary) or title+company (fallback)"""
     url = normalize_url(job.get('url', ''))
     if url:
-        return hashlib.sha256(url.encode()).hexdigest()[:16]
+        return url_hash(url)
     
     title = job.get('title', '').lower()
     company = job.get('company', '').lower()
@@ -1100,18 +1374,25 @@ def extract_urls_from_text(text: str) -> List[str]:
     return [url.rstrip(').,]>\'"') for url in re.findall(r'https?://[^\s\])>]+', text)]
 
 
-def is_duplicate_job(job: Dict, db: DatabaseConnection, recent_fps: Optional[List[str]] = None) -> bool:
-    """Exact URL-hash + fuzzy title/company dedup against recent posts."""
-    # Cleanup old records (default 28 days — fewer reposts than 7d)
-    retention = getattr(Config, 'DEDUP_RETENTION_DAYS', 28) or 28
-    cleanup_threshold = datetime.now() - timedelta(days=retention)
-    db.execute('DELETE FROM posted_jobs WHERE posted_at < ?', (cleanup_threshold,))
-    
-    job_hash = generate_job_hash(job)
+def is_duplicate_job(
+    job: Dict,
+    db: DatabaseConnection,
+    recent_fps: Optional[List[str]] = None,
+    known_hashes: Optional[set] = None,
+) -> bool:
+    """Exact URL-hash + fuzzy title/company dedup against recent posts.
+
+    Expired rows are purged on a daily cadence via purge_expired_jobs(), not here.
+    Pass known_hashes (from db.get_existing_hashes) to skip the per-job SELECT.
+    """
+    job_hash = job.get('hash') or generate_job_hash(job)
     job['hash'] = job_hash  # Сохраняем hash в job для дальнейшего использования
     
     # Check if exists
-    result = db.fetchone('SELECT 1 FROM posted_jobs WHERE hash = ?', (job_hash,))
+    if known_hashes is not None:
+        result = job_hash in known_hashes
+    else:
+        result = job_hash in db.get_existing_hashes([job_hash])
     if result:
         logger.debug(f"⏭️ Duplicate skipped: {job.get('title', 'N/A')}")
         return True
@@ -1126,44 +1407,79 @@ def is_duplicate_job(job: Dict, db: DatabaseConnection, recent_fps: Optional[Lis
     return False
 
 
-def register_posted_job(job: Dict, db: DatabaseConnection) -> None:
-    """Register a job after it has been successfully posted."""
+def purge_expired_jobs(db: DatabaseConnection) -> bool:
+    """Retention cleanup (default 28 days — fewer reposts than 7d), at most once per interval.
+
+    Both pipelines call this every cycle; the last run is kept in meta, so the
+    daily cadence survives restarts and serverless cold starts.
+    """
+    now = time.time()
+    row = db.fetchone("SELECT value FROM meta WHERE key = 'last_purge_at'")
+    try:
+        if row and now - float(row[0]) < Config.DEDUP_CLEANUP_INTERVAL_HOURS * 3600:
+            return False
+    except (TypeError, ValueError):
+        pass  # unreadable marker — purge and rewrite it
+    if not db.purge_expired(getattr(Config, 'DEDUP_RETENTION_DAYS', 28) or 28):
+        return False  # marker left as is: retried next cycle
+    db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", ('last_purge_at', str(now)))
+    logger.info("🧹 Expired dedup rows purged")
+    return True
+
+
+def _posted_job_row(job: Dict) -> tuple:
     job_hash = job.get('hash') or generate_job_hash(job)
     job['hash'] = job_hash
     fp = ''
     if GROWTH_UTILS_AVAILABLE:
         fp = job_fingerprint(job)
         job['fingerprint'] = fp
-    try:
-        db.execute(
-            'INSERT OR IGNORE INTO posted_jobs (hash, title, company, level, url, source, category, fingerprint) '
-            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
-            (
-                job_hash,
-                job.get('title', ''),
-                job.get('company', ''),
-                job.get('level', 'Junior'),
-                job.get('url', ''),
-                job.get('source', ''),
-                job.get('category', 'other'),
-                fp,
+    return (
+        job_hash,
+        job.get('title', ''),
+        job.get('company', ''),
+        job.get('level', 'Junior'),
+        job.get('url', ''),
+        job.get('source', ''),
+        job.get('category', 'other'),
+        fp,
+    )
+
+
+def register_posted_jobs(jobs: List[Dict], db: DatabaseConnection) -> None:
+    """Register successfully posted jobs in one executemany + commit."""
+    if not jobs:
+        return
+    rows = [_posted_job_row(job) for job in jobs]
+    # One transaction (and db lock) for check + insert + counters, so /status reading
+    # from a worker thread sees either none or all of this batch
+    with db.transaction():
+        # INSERT OR IGNORE skips known hashes; only genuinely new rows move the counters
+        existing = db.get_existing_hashes([row[0] for row in rows])
+        new_rows = {row[0]: row for row in rows if row[0] not in existing}
+        new_categories: Dict[str, int] = {}
+        for row in new_rows.values():
+            new_categories[row[6]] = new_categories.get(row[6], 0) + 1
+        try:
+            db.executemany(
+                'INSERT OR IGNORE INTO posted_jobs (hash, title, company, level, url, source, category, fingerprint) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                rows,
             )
-        )
-    except sqlite3.OperationalError:
-        # Pre-migration DBs without fingerprint column
-        db.execute(
-            'INSERT OR IGNORE INTO posted_jobs (hash, title, company, level, url, source, category) VALUES (?, ?, ?, ?, ?, ?, ?)',
-            (
-                job_hash,
-                job.get('title', ''),
-                job.get('company', ''),
-                job.get('level', 'Junior'),
-                job.get('url', ''),
-                job.get('source', ''),
-                job.get('category', 'other')
+        except sqlite3.OperationalError as e:
+            if is_sqlite_busy(e):
+                raise
+            # Pre-migration DBs without fingerprint column
+            db.executemany(
+                'INSERT OR IGNORE INTO posted_jobs (hash, title, company, level, url, source, category) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [row[:7] for row in rows],
             )
-        )
-    logger.debug(f"💾 Saved new job: {job.get('title', 'N/A')}")
+        # posted_at defaults to CURRENT_TIMESTAMP (UTC text); mirror it for cache expiry.
+        # Known hashes keep their stored posted_at (OR IGNORE left the row untouched).
+        posted_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        db.remember_hashes((job_hash, posted_at) for job_hash in new_rows)
+        db.adjust_category_counts(new_categories)
+    logger.debug(f"💾 Saved {len(rows)} new job(s)")
 
 
 def run_hash_migration(db: DatabaseConnection) -> bool:
@@ -1194,8 +1510,8 @@ def run_hash_migration(db: DatabaseConnection) -> bool:
 
         logger.info("🔄 Starting hash migration for posted_jobs...")
 
-        # Load all existing rows
-        c.execute("SELECT rowid, hash, url, title, company FROM posted_jobs ORDER BY rowid")
+        # Load all existing rows (oldest first: on hash collisions the first post wins)
+        c.execute(f"SELECT {POSTED_JOBS_COLUMNS} FROM posted_jobs ORDER BY posted_at")
         rows = c.fetchall()
         if not rows:
             logger.info("✅ No posted_jobs to migrate")
@@ -1204,42 +1520,39 @@ def run_hash_migration(db: DatabaseConnection) -> bool:
             return True
 
         # Compute new hashes and keep old->new mapping for user_favorites sync
-        new_hashes: Dict[str, List[int]] = {}
+        migrated: Dict[str, tuple] = {}
         old_to_new: Dict[str, str] = {}
         for row in rows:
-            rowid, old_hash, url, title, company = row
+            old_hash, title, company, _level, url = row[:5]
             job = {'url': url or '', 'title': title or '', 'company': company or ''}
             new_hash = generate_job_hash(job)
-            new_hashes.setdefault(new_hash, []).append(rowid)
+            migrated.setdefault(new_hash, (new_hash,) + tuple(row[1:]))
             old_to_new[old_hash] = new_hash
 
-        deleted_count = 0
-        updated_count = 0
-        for new_hash, rowids in new_hashes.items():
-            if len(rowids) > 1:
-                keep_rowid = min(rowids)
-                to_delete = [rid for rid in rowids if rid != keep_rowid]
-                for rid in to_delete:
-                    c.execute("DELETE FROM posted_jobs WHERE rowid = ?", (rid,))
-                    deleted_count += 1
-                c.execute("UPDATE posted_jobs SET hash = ? WHERE rowid = ?", (new_hash, keep_rowid))
-                updated_count += 1
-            else:
-                c.execute("UPDATE posted_jobs SET hash = ? WHERE rowid = ?", (new_hash, rowids[0]))
-                updated_count += 1
+        # Rows are keyed by hash (no rowid), so rewrite the table in one pass
+        deleted_count = len(rows) - len(migrated)
+        updated_count = len(migrated)
+        c.execute("DELETE FROM posted_jobs")
+        placeholders = ', '.join('?' * len(POSTED_JOBS_COLUMNS.split(',')))
+        c.executemany(
+            f"INSERT INTO posted_jobs ({POSTED_JOBS_COLUMNS}) VALUES ({placeholders})",
+            list(migrated.values()),
+        )
 
-        # Sync user_favorites so they point to new hashes and remove orphans
-        for old_hash, new_hash in old_to_new.items():
-            c.execute(
-                "UPDATE user_favorites SET job_hash = ? WHERE job_hash = ?",
-                (new_hash, old_hash)
-            )
+        # Sync user_favorites and job_payloads to the new hashes. OR IGNORE + DELETE:
+        # when two old hashes collapse into one, the first copy wins instead of
+        # aborting the migration on a UNIQUE conflict.
+        renamed = [(new_hash, old_hash) for old_hash, new_hash in old_to_new.items() if old_hash != new_hash]
+        c.executemany("UPDATE OR IGNORE user_favorites SET job_hash = ? WHERE job_hash = ?", renamed)
+        c.executemany("UPDATE OR IGNORE job_payloads SET hash = ? WHERE hash = ?", renamed)
+        c.executemany("DELETE FROM job_payloads WHERE hash = ?", [(old_hash,) for _, old_hash in renamed])
         c.execute(
             "DELETE FROM user_favorites WHERE job_hash NOT IN (SELECT hash FROM posted_jobs)"
         )
 
         c.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", ('hash_migration_done', '1'))
         conn.commit()
+        db.reset_hash_cache()
         logger.info(
             f"✅ Hash migration complete: {updated_count} updated, {deleted_count} duplicates removed"
         )
@@ -1263,28 +1576,113 @@ def run_hash_migration(db: DatabaseConnection) -> bool:
         return False
 
 # ==================== UTILS ====================
+def load_json(response: "requests.Response"):
+    """Parse a JSON response body with orjson when installed (stdlib json otherwise)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass  # non-UTF-8 or non-strict JSON — let requests sniff the encoding
+    return response.json()
+
+
+# One UA per process: rotating per request buys nothing over a kept-alive connection
+_USER_AGENT = random.choice(USER_AGENTS)
+
+
 def get_headers() -> Dict[str, str]:
-    return {"User-Agent": random.choice(USER_AGENTS)}
+    return {"User-Agent": _USER_AGENT}
+
+
+class HostLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that caps in-flight requests per host across all fetcher threads.
+
+    Different hosts don't share rate limits, so sources run fully in parallel;
+    only requests to the same host queue up behind each other.
+    """
+
+    def __init__(self, per_host: int, **kwargs):
+        self._per_host = max(1, per_host)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self._per_host)
+            return slot
+
+    def send(self, request, **kwargs):
+        with self._slot(urlsplit(request.url).hostname or ''):
+            response = super().send(request, **kwargs)
+            if not kwargs.get('stream'):
+                # Session.send reads the body only after send() returns; read it here so
+                # the slot covers the whole download (stream=True callers are on their own)
+                response.content
+            return response
+
+
+def build_http_session() -> requests.Session:
+    """Shared keep-alive session for all fetchers (env proxies are still honoured per request)."""
+    session = requests.Session()
+    # Accept-Encoding stays requests' default: gzip/deflate, plus br once brotli is installed
+    session.headers.update(get_headers())
+    # Only connection setup is retried here; HTTP errors and 429 stay with safe_fetch_with_retry
+    retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5)
+    adapter = HostLimitedAdapter(
+        Config.HTTP_PER_HOST_LIMIT, pool_connections=8, pool_maxsize=16, max_retries=retry
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+HTTP_SESSION = build_http_session()
+
+
+def map_concurrently(func, items, max_workers: int = 6) -> List:
+    """Run a blocking func over items in a small thread pool, results in input order.
+
+    For fetchers that hit one endpoint per board/company/country: latency becomes
+    max-of instead of sum-of. func is expected to handle its own errors.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix='fetch-part') as pool:
+        return list(pool.map(func, items))
 
 
 def escape_html(text: str) -> str:
     """Escape HTML special characters safely"""
     if not text:
         return ''
-    return (
-        text.replace('&', '&amp;')
-            .replace('<', '&lt;')
-            .replace('>', '&gt;')
-            .replace('"', '&quot;')
-    )
+    # stdlib escape is a single pass in C; quote=True also covers ' (&#x27;)
+    return html.escape(text, quote=True)
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+
+def collapse_whitespace(text: str) -> str:
+    """Collapse whitespace runs to single spaces; skips the regex for already clean text."""
+    # isprintable() is False for tabs/newlines/NBSP and other non-space whitespace
+    if '  ' not in text and text.isprintable():
+        return text.strip()
+    return _WS_RE.sub(' ', text).strip()
 
 
 def strip_html(text: str) -> str:
     """Remove HTML tags and normalize whitespace."""
     if not text:
         return ''
-    text = re.sub(r'<[^>]+>', ' ', str(text))
-    return ' '.join(text.split())
+    text = str(text)
+    if '<' in text:
+        text = _TAG_RE.sub(' ', text)
+    return collapse_whitespace(text)
 
 
 def first_text(parent, *names: str) -> str:
@@ -1300,19 +1698,85 @@ def non_empty_csv(values: List[str]) -> List[str]:
     return [value.strip() for value in values if value and value.strip()]
 
 
-def has_text_signal(text: str, signal: str) -> bool:
-    """Match a keyword or phrase without accidental substring hits."""
-    signal = signal.strip().lower()
-    if not signal:
-        return False
-    pattern = r'(?<![\w])' + re.escape(signal) + r'(?![\w])'
-    return re.search(pattern, text, flags=re.IGNORECASE) is not None
+def compile_signal_pattern(signals: List[str]) -> "re.Pattern":
+    """Compile keywords/phrases into one alternation matching only where neither side touches a word char.
+
+    Expects lowercased input text. Longest phrases go first so that e.g. "staff engineer"
+    is tried before "staff".
+    """
+    cleaned = sorted({s.strip().lower() for s in signals if s and s.strip()}, key=len, reverse=True)
+    return re.compile(r'(?<![\w])(?:' + '|'.join(map(re.escape, cleaned)) + r')(?![\w])')
+
+
+def job_text_lower(job: Dict) -> str:
+    """Lowercased "title description", computed once and cached on the job.
+
+    The cache is keyed by the title/description objects, so normalize_job_title_company
+    (or any other rewrite) transparently invalidates it.
+    """
+    title = job.get('title', '')
+    description = job.get('description', '')
+    cached = job.get('_text_lower')
+    if cached and cached[0] is title and cached[1] is description:
+        return cached[2]
+    text = f"{title} {description}".lower()
+    job['_text_lower'] = (title, description, text)
+    return text
+
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def text_tokens(text: str) -> frozenset:
+    """Set of \\w+ tokens — a single-word signal matches whole-word iff it is one of them."""
+    return frozenset(_TOKEN_RE.findall(text))
+
+
+def job_text_tokens(job: Dict) -> frozenset:
+    """Tokens of job_text_lower(job), cached alongside it."""
+    text = job_text_lower(job)
+    cached = job.get('_text_tokens')
+    if cached and cached[0] is text:
+        return cached[1]
+    tokens = text_tokens(text)
+    job['_text_tokens'] = (text, tokens)
+    return tokens
+
+
+class SignalSet:
+    """Whole-word signal matcher: one-word signals by token-set lookup, phrases by regex."""
+
+    __slots__ = ('tokens', 'phrases', 'phrase_re')
+
+    def __init__(self, signals: List[str]):
+        cleaned = {s.strip().lower() for s in signals if s and s.strip()}
+        self.tokens = frozenset(s for s in cleaned if _TOKEN_RE.fullmatch(s))
+        self.phrases = frozenset(cleaned - self.tokens)
+        self.phrase_re = compile_signal_pattern(list(self.phrases)) if self.phrases else None
+
+    def search(self, text: str, tokens: Optional[frozenset] = None) -> bool:
+        """True if any signal occurs in lowercased text as a whole word (not inside another word)."""
+        if tokens is None:
+            tokens = text_tokens(text)
+        if not self.tokens.isdisjoint(tokens):
+            return True
+        return self.phrase_re is not None and self.phrase_re.search(text) is not None
+
+
+def compile_substring_pattern(keywords: List[str]) -> "re.Pattern":
+    """One alternation equivalent to any(kw in text for kw in keywords) on lowercased text."""
+    cleaned = sorted({k.lower() for k in keywords if k}, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, cleaned)))
+
 
+RESUME_BLOCK_RE = compile_substring_pattern(RESUME_BLOCK_SIGNALS)
+REMOTE_KEYWORDS_RE = compile_substring_pattern(REMOTE_KEYWORDS)
 
-def is_resume_or_candidate_profile_text(text: str) -> bool:
+
+def is_resume_or_candidate_profile_text(text: str, lowered: bool = False) -> bool:
     """Detect resume/CV/candidate-profile posts that are not vacancies."""
-    text_lower = str(text or '').lower()
-    return any(signal in text_lower for signal in RESUME_BLOCK_SIGNALS)
+    text_lower = text if lowered else str(text or '').lower()
+    return RESUME_BLOCK_RE.search(text_lower) is not None
 
 
 def base_source_name(job: Dict) -> str:
@@ -1320,27 +1784,34 @@ def base_source_name(job: Dict) -> str:
     return str(job.get('source', '') or 'Unknown').split(':', 1)[0].strip() or 'Unknown'
 
 
-def parse_job_datetime(job: Dict) -> Optional[datetime]:
-    """Best-effort parsing of heterogeneous source date fields."""
-    raw = job.get('published') or job.get('created') or job.get('publication_date') or job.get('date_published')
-    if not raw:
-        return None
-    value = str(raw).strip()
-    if not value:
-        return None
+@lru_cache(maxsize=4096)
+def _parse_date_text(value: str) -> Optional[datetime]:
+    """Naive datetime from a source date string (cached: the same strings recur across cycles)."""
+    # fromisoformat accepts a trailing "Z" natively since Python 3.11
     for candidate in (value, value[:19], value[:10]):
         try:
-            return datetime.fromisoformat(candidate.replace('Z', '+00:00')).replace(tzinfo=None)
-        except Exception:
+            return datetime.fromisoformat(candidate).replace(tzinfo=None)
+        except ValueError:
             pass
     for fmt in ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y'):
         try:
             return datetime.strptime(value[:10], fmt)
-        except Exception:
+        except ValueError:
             pass
     return None
 
 
+def parse_job_datetime(job: Dict) -> Optional[datetime]:
+    """Best-effort parsing of heterogeneous source date fields."""
+    raw = job.get('published') or job.get('created') or job.get('publication_date') or job.get('date_published')
+    if not raw:
+        return None
+    value = str(raw).strip()
+    if not value:
+        return None
+    return _parse_date_text(value)
+
+
 def job_quality_score(job: Dict) -> tuple:
     """Rank jobs inside each source: quality score first, then recency."""
     published = parse_job_datetime(job)
@@ -1358,15 +1829,68 @@ def job_quality_score(job: Dict) -> tuple:
     return (quality, timestamp)
 
 
+def _cross_listing_key(job: Dict) -> Tuple[str, ...]:
+    """Same title+company = one vacancy listed by several sources.
+
+    Jobs without a company are keyed by URL too, so unrelated "Python Developer"
+    posts from anonymous channels are not merged.
+    """
+    title = str(job.get('title', '') or '').strip().lower()
+    company = str(job.get('company', '') or '').strip().lower()
+    return (title, company) if company else (title, '', str(job.get('url', '') or ''))
+
+
+def prepare_candidates(jobs: List[Dict], stats: Optional[Dict] = None) -> List[Dict]:
+    """One pass over fetched jobs: filter, set level/category/hash, apply salary and track filters.
+
+    Cross-listed copies (same title+company, or same normalized URL hash) are collapsed
+    only among jobs that passed every filter, so a copy rejected for one source's
+    missing salary or level tag cannot hide a passing copy from another source.
+    The number of collapsed copies is stored in stats['cross_listed'] when given.
+    """
+    candidates = []
+    cross_listed = 0
+    seen_keys = set()
+    seen_hashes = set()
+    for job in jobs:
+        if GROWTH_UTILS_AVAILABLE:
+            normalize_job_title_company(job)
+        if not is_suitable_job(job):
+            continue
+        level = classify_job_level(job)
+        if not level:
+            continue
+        job['level'] = level
+        job['category'] = auto_classify_category(job)
+        if GROWTH_UTILS_AVAILABLE:
+            enrich_job_salary_fields(job)
+            if not passes_min_salary(job, Config.GLOBAL_MIN_SALARY_USD):
+                continue
+            if not passes_channel_tracks(job, Config.CHANNEL_TRACKS):
+                continue
+        listing_key = _cross_listing_key(job)
+        job_hash = generate_job_hash(job)  # once per job; reused by dedup/post/register
+        if listing_key in seen_keys or job_hash in seen_hashes:
+            cross_listed += 1
+            continue
+        seen_keys.add(listing_key)
+        seen_hashes.add(job_hash)
+        job['hash'] = job_hash
+        candidates.append(job)
+    if stats is not None:
+        stats['cross_listed'] = cross_listed
+    return candidates
+
+
 def diversify_jobs_by_source(jobs: List[Dict], limit: int) -> List[Dict]:
     """Round-robin jobs across source families instead of draining early sources first."""
     grouped: "OrderedDict[str, List[Dict]]" = OrderedDict()
     for job in jobs:
         grouped.setdefault(base_source_name(job), []).append(job)
-    for source_jobs in grouped.values():
-        source_jobs.sort(key=job_quality_score, reverse=True)
+    # A source contributes at most `limit` jobs, so only its top `limit` need ranking
     grouped = OrderedDict(
-        sorted(
+        (source, heapq.nlargest(limit, source_jobs, key=job_quality_score))
+        for source, source_jobs in sorted(
             grouped.items(),
             key=lambda item: (SOURCE_PUBLICATION_PRIORITY.get(item[0], 100), item[0].lower())
         )
@@ -1409,7 +1933,6 @@ def safe_fetch_with_retry(fetch_func, source_name: str, max_retries: int = 3) ->
     for attempt in range(max_retries):
         try:
             result = fetch_func()
-            time.sleep(DELAYS['between_apis'] + random.uniform(0, DELAYS['random_jitter']))
             elapsed = int((time.monotonic() - t0) * 1000)
             if EXTRA_SOURCES_AVAILABLE and SOURCE_HEALTH is not None:
                 SOURCE_HEALTH.record(source_name, len(result or []), elapsed_ms=elapsed)
@@ -1432,21 +1955,184 @@ def safe_fetch_with_retry(fetch_func, source_name: str, max_retries: int = 3) ->
         SOURCE_HEALTH.record(source_name, 0, error=last_err or "failed", elapsed_ms=int((time.monotonic() - t0) * 1000))
     return []
 
+
+async def fetch_all_api_sources(
+    api_fetch_functions: List[Tuple],
+    max_retries: int = 3,
+    timeout: Optional[float] = None,
+    source_results: Optional[List[Dict]] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> List[Dict]:
+    """Run API fetchers in the executor, at most FETCH_CONCURRENCY sources at a time.
+
+    Same-host requests are additionally capped by HTTP_SESSION. Sources not finished
+    after `timeout` seconds (running or still queued) are skipped for this cycle, but a
+    running worker thread can't be interrupted: it holds its executor until the request
+    returns. executor defaults to the loop's shared pool, which asyncio.run() joins on
+    exit — pass a dedicated pool (see fetch_api_sources_within_budget) when the caller's
+    wall time must stay within `timeout`. Per-source counts are appended to
+    source_results when given.
+    """
+    if not api_fetch_functions:
+        return []
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max(1, Config.FETCH_CONCURRENCY))
+
+    async def run_one(fetch_func, source_name):
+        async with semaphore:
+            return await loop.run_in_executor(
+                executor, safe_fetch_with_retry, fetch_func, source_name, max_retries
+            )
+
+    futures = [
+        asyncio.ensure_future(run_one(fetch_func, source_name))
+        for fetch_func, source_name in api_fetch_functions
+    ]
+    await asyncio.wait(futures, timeout=None if timeout is None else max(0.0, timeout))
+    all_jobs: List[Dict] = []
+    for (_, source_name), future in zip(api_fetch_functions, futures):
+        if not future.done():
+            future.cancel()
+            logger.warning(f"⏱️ Source budget exceeded, skipping {source_name}")
+            if source_results is not None:
+                source_results.append({'source': source_name, 'fetched': 0, 'timed_out': True})
+            continue
+        if future.exception() is not None:
+            logger.error(f"❌ {source_name} fetch crashed: {future.exception()}")
+            jobs = []
+        else:
+            jobs = future.result() or []
+        all_jobs.extend(jobs)
+        if source_results is not None:
+            source_results.append({'source': source_name, 'fetched': len(jobs)})
+        logger.info(f"📥 Fetched {len(jobs)} jobs from {source_name}")
+    return all_jobs
+
+
+async def fetch_api_sources_within_budget(
+    api_fetch_functions: List[Tuple],
+    timeout: Optional[float],
+    max_retries: int = 1,
+    source_results: Optional[List[Dict]] = None,
+) -> List[Dict]:
+    """fetch_all_api_sources on a throwaway pool that is never joined.
+
+    Timed-out fetches keep running in their threads; shutting the pool down with
+    wait=False lets the caller (and asyncio.run) return at the budget instead of
+    waiting for the slowest upstream request.
+    """
+    pool = ThreadPoolExecutor(
+        max_workers=max(1, min(len(api_fetch_functions), Config.FETCH_CONCURRENCY)),
+        thread_name_prefix='fetch',
+    )
+    try:
+        return await fetch_all_api_sources(
+            api_fetch_functions,
+            max_retries=max_retries,
+            timeout=timeout,
+            source_results=source_results,
+            executor=pool,
+        )
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 # ==================== JOB PROCESSING ====================
+# Keyword lists prepared once: token-set intersection for single words, one regex for phrases.
+EXCLUDE_SET = SignalSet(EXCLUDE_SIGNALS)
+JUNIOR_SET = SignalSet(JUNIOR_SIGNALS)
+MIDDLE_SET = SignalSet(MIDDLE_SIGNALS)
+TITLE_IT_SET = SignalSet(TITLE_IT_SIGNALS)
+NON_IT_TITLE_SET = SignalSet(NON_IT_TITLE_EXCLUDES)
+TECH_CANONICAL = {tech.lower(): tech for tech in TECH_STACK}
+TECH_CANONICAL.update(TECH_ALIASES)
+TECH_SET = SignalSet(list(TECH_CANONICAL))
+
+# Level and tech signals fused into one scan: signal -> bitmask of the lists it belongs to
+LEVEL_EXCLUDE, LEVEL_JUNIOR, LEVEL_MIDDLE, SIGNAL_TECH = 1, 2, 4, 8
+
+
+def _build_signal_scanner():
+    token_bits: Dict[str, int] = {}
+    phrase_bits: Dict[str, int] = {}
+    for bit, signal_set in (
+        (LEVEL_EXCLUDE, EXCLUDE_SET),
+        (LEVEL_JUNIOR, JUNIOR_SET),
+        (LEVEL_MIDDLE, MIDDLE_SET),
+        (SIGNAL_TECH, TECH_SET),
+    ):
+        for token in signal_set.tokens:
+            token_bits[token] = token_bits.get(token, 0) | bit
+        for phrase in signal_set.phrases:
+            phrase_bits[phrase] = phrase_bits.get(phrase, 0) | bit
+    # Zero-width lookahead reports a phrase at every start position, so hits from
+    # different lists cannot hide each other
+    alternation = '|'.join(map(re.escape, sorted(phrase_bits, key=len, reverse=True)))
+    phrase_re = re.compile(r'(?=(?<![\w])(' + alternation + r')(?![\w]))')
+    return token_bits, phrase_bits, phrase_re
+
+
+_SIGNAL_TOKEN_BITS, _SIGNAL_PHRASE_BITS, _SIGNAL_PHRASE_RE = _build_signal_scanner()
+
+
+# Scan results by digest of the job text: the same postings come back every cycle
+_SIGNAL_SCAN_CACHE: "OrderedDict[bytes, Tuple[int, frozenset]]" = OrderedDict()
+_SIGNAL_SCAN_CACHE_SIZE = 8192
+
+
+def _scan_text_signals(text: str, tokens: frozenset) -> Tuple[int, frozenset]:
+    bits = 0
+    techs = set()
+    for token in _SIGNAL_TOKEN_BITS.keys() & tokens:
+        token_bits = _SIGNAL_TOKEN_BITS[token]
+        bits |= token_bits
+        if token_bits & SIGNAL_TECH:
+            techs.add(TECH_CANONICAL[token])
+    for match in _SIGNAL_PHRASE_RE.finditer(text):
+        phrase = match.group(1)
+        phrase_bits = _SIGNAL_PHRASE_BITS[phrase]
+        bits |= phrase_bits
+        if phrase_bits & SIGNAL_TECH:
+            techs.add(TECH_CANONICAL[phrase])
+    return bits, frozenset(techs)
+
+
+def scan_job_signals(job: Dict) -> Tuple[int, frozenset]:
+    """One pass over the job text: (LEVEL_*/SIGNAL_TECH bitmask, canonical tech names).
+
+    Cached on the job next to job_text_lower, so classification and skill
+    extraction share a single scan, and across cycles in a bounded LRU keyed by
+    a 16-byte digest of the text (descriptions themselves are never kept).
+    """
+    text = job_text_lower(job)
+    cached = job.get('_signals')
+    if cached and cached[0] is text:
+        return cached[1], cached[2]
+    key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    result = _SIGNAL_SCAN_CACHE.get(key)
+    if result is None:
+        result = _scan_text_signals(text, job_text_tokens(job))
+        _SIGNAL_SCAN_CACHE[key] = result
+        if len(_SIGNAL_SCAN_CACHE) > _SIGNAL_SCAN_CACHE_SIZE:
+            _SIGNAL_SCAN_CACHE.popitem(last=False)
+    else:
+        _SIGNAL_SCAN_CACHE.move_to_end(key)
+    job['_signals'] = (text,) + result
+    return result
+
+
 def classify_job_level(job_data: Dict) -> Optional[str]:
     """Classify job level with exclusion logic"""
-    title_text = str(job_data.get('title', '')).lower()
-    full_text = f"{job_data.get('title', '')} {job_data.get('description', '')}".lower()
+    bits, _ = scan_job_signals(job_data)
     
     # Exclude senior+ roles first
-    if any(has_text_signal(full_text, word) for word in EXCLUDE_SIGNALS):
+    if bits & LEVEL_EXCLUDE:
         return None
-    
-    if any(has_text_signal(full_text, signal) for signal in JUNIOR_SIGNALS):
+    if bits & LEVEL_JUNIOR:
         return "Junior"
-    if any(has_text_signal(full_text, signal) for signal in MIDDLE_SIGNALS):
+    if bits & LEVEL_MIDDLE:
         return "Middle"
-    if any(has_text_signal(title_text, role) for role in TITLE_IT_SIGNALS):
+    title_text = str(job_data.get('title', '')).lower()
+    if TITLE_IT_SET.search(title_text):
         return "Junior"
     return None
 
@@ -1455,13 +2141,50 @@ def auto_classify_category(job: Dict) -> str:
     """Автоматическая классификация категории"""
     if CLASSIFIER_AVAILABLE:
         try:
-            classifier = JobClassifier()
-            return classifier.classify(job)
+            # Shared instance: category tables are built once, not per job
+            return get_classifier().classify(job)
         except Exception as e:
             logger.error(f"Error classifying job: {e}")
     return 'other'
 
 
+def _salary_amount(value):
+    """Salary bound as int, None when missing or not positive; unparsable text is kept as is."""
+    if isinstance(value, str):
+        text = value.replace(',', '').replace(' ', '')
+        if not text:
+            return None
+        try:
+            value = float(text)
+        except ValueError:
+            return value
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value or None
+    if value <= 0:
+        return None
+    return int(round(value))
+
+
+def _format_amount(value) -> str:
+    return f"{value:,}" if isinstance(value, int) else str(value)
+
+
+def format_salary(lo, hi, currency: str = '', symbol: str = '') -> str:
+    """Format a salary range: "$1,000-$2,000 USD", "от 1,000 RUB", "до $2,000".
+
+    Bounds of 0 or below count as missing.
+    """
+    lo, hi = _salary_amount(lo), _salary_amount(hi)
+    suffix = f" {currency}" if currency else ''
+    if lo and hi:
+        return f"{symbol}{_format_amount(lo)}-{symbol}{_format_amount(hi)}{suffix}"
+    if lo:
+        return f"от {symbol}{_format_amount(lo)}{suffix}"
+    if hi:
+        return f"до {symbol}{_format_amount(hi)}{suffix}"
+    return 'Не указана'
+
+
 def extract_salary(job: Dict) -> str:
     """Extract and format salary; side-effect: attach salary_min_usd when possible."""
     if GROWTH_UTILS_AVAILABLE:
@@ -1473,12 +2196,8 @@ def extract_salary(job: Dict) -> str:
     
     min_sal = job.get('minSalary', 0) or job.get('salary_min', 0)
     max_sal = job.get('maxSalary', 0) or job.get('salary_max', 0)
-    if min_sal and max_sal and (min_sal > 0 or max_sal > 0):
-        currency = job.get('currency', 'USD')
-        if min_sal > 0 and max_sal > 0:
-            return f"${min_sal:,}-${max_sal:,} {currency}"
-        elif max_sal > 0:
-            return f"до ${max_sal:,} {currency}"
+    if min_sal and max_sal:
+        return format_salary(min_sal, max_sal, job.get('currency', 'USD'), '$')
     return 'Не указана'
 
 
@@ -1491,12 +2210,35 @@ def extract_skills(job: Dict) -> List[str]:
             if isinstance(tag, str) and len(tag) < 25:
                 skills.add(tag.strip().title())
     
-    text = f"{job.get('title', '')} {job.get('description', '')}".lower()
-    for tech in TECH_STACK:
-        if tech.lower() in text:
-            skills.add(tech)
+    # Whole-word matches only: "Go" no longer fires on "Google", nor "Java" on "JavaScript"
+    skills.update(scan_job_signals(job)[1])
     
-    return sorted(list(skills))[:5]
+    return heapq.nsmallest(5, skills)
+
+
+_MONTHS_RU = ('янв', 'фев', 'мар', 'апр', 'май', 'июн', 'июл', 'авг', 'сен', 'окт', 'ноя', 'дек')
+
+
+@lru_cache(maxsize=2048)
+def _format_posted_date(date_raw) -> str:
+    """Format a raw source date as "5 мар" (cached: jobs in a cycle share dates)."""
+    if isinstance(date_raw, (int, float)) and not isinstance(date_raw, bool):
+        # Unix epoch (seconds or milliseconds)
+        ts = date_raw / 1000 if date_raw > 1e11 else date_raw
+        try:
+            dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return "Недавно"
+        return f"{dt.day} {_MONTHS_RU[dt.month-1]}"
+    value = str(date_raw)
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            dt = datetime.strptime(value[:10], '%Y-%m-%d')
+        except ValueError:
+            return "Недавно"
+    return f"{dt.day} {_MONTHS_RU[dt.month-1]}"
 
 
 def extract_posted_date(job: Dict) -> str:
@@ -1504,18 +2246,9 @@ def extract_posted_date(job: Dict) -> str:
     date_raw = job.get('published') or job.get('created') or job.get('publication_date') or job.get('date_published')
     if not date_raw:
         return "Недавно"
-    
-    try:
-        dt = datetime.fromisoformat(str(date_raw).replace('Z', '+00:00'))
-        months_ru = ['янв', 'фев', 'мар', 'апр', 'май', 'июн', 'июл', 'авг', 'сен', 'окт', 'ноя', 'дек']
-        return f"{dt.day} {months_ru[dt.month-1]}"
-    except:
-        try:
-            dt = datetime.strptime(str(date_raw)[:10], '%Y-%m-%d')
-            months_ru = ['янв', 'фев', 'мар', 'апр', 'май', 'июн', 'июл', 'авг', 'сен', 'окт', 'ноя', 'дек']
-            return f"{dt.day} {months_ru[dt.month-1]}"
-        except:
-            return "Недавно"
+    if not isinstance(date_raw, (str, int, float)):
+        date_raw = str(date_raw)
+    return _format_posted_date(date_raw)
 
 
 def extract_employment_type(job: Dict) -> str:
@@ -1536,20 +2269,32 @@ def extract_employment_type(job: Dict) -> str:
 def extract_description(job: Dict, max_length: int = 350) -> str:
     """Extract and sanitize description"""
     desc = job.get('description', '')
-    desc = re.sub(r'<[^>]+>', '', desc)
-    desc = ' '.join(desc.split())
+    if '<' in desc:
+        desc = _TAG_RE.sub('', desc)
+    desc = collapse_whitespace(desc)
     if len(desc) > max_length:
-        desc = desc[:max_length].rsplit(' ', 1)[0] + '...'
+        cut = desc.rfind(' ', 0, max_length)
+        desc = desc[:cut if cut != -1 else max_length] + '...'
     return desc or "Описание не указано"
 
 
+def has_it_title(title) -> bool:
+    """Cheap pre-filter for fetchers, run before HTML stripping and dict building.
+
+    is_suitable_job rejects every title without an IT signal; title normalization
+    only ever shortens the title, so such a job can never become suitable later.
+    """
+    title = str(title or '').lower()
+    return TITLE_IT_SET.search(title, text_tokens(title))
+
+
 def is_suitable_job(job: Dict) -> bool:
     """Check if job matches criteria (remote + IT role)"""
     title = str(job.get('title', '')).lower()
-    text = f"{job.get('title', '')} {job.get('description', '')} {job.get('location', '')}".lower()
+    text = f"{job_text_lower(job)} {str(job.get('location', '')).lower()}"
     source_full = str(job.get('source', '') or '')
     source = source_full.split(':', 1)[0]
-    if is_resume_or_candidate_profile_text(text):
+    if is_resume_or_candidate_profile_text(text, lowered=True):
         return False
     if source == 'TG' and not str(job.get('url', '')).startswith('http'):
         return False
@@ -1557,14 +2302,49 @@ def is_suitable_job(job: Dict) -> bool:
         source_full in REMOTE_ONLY_SOURCES
         or source in REMOTE_ONLY_SOURCES
         or source_full.startswith('RSS:')
-        or any(kw in text for kw in REMOTE_KEYWORDS)
+        or REMOTE_KEYWORDS_RE.search(text) is not None
     )
-    if any(has_text_signal(title, signal) for signal in NON_IT_TITLE_EXCLUDES):
+    title_tokens = text_tokens(title)
+    if NON_IT_TITLE_SET.search(title, title_tokens):
         return False
-    has_it_role = any(has_text_signal(title, role) for role in TITLE_IT_SIGNALS)
+    has_it_role = TITLE_IT_SET.search(title, title_tokens)
     return has_remote and has_it_role
 
 
+TELEGRAM_MESSAGE_LIMIT = 4096
+_HTML_TAG_RE = re.compile(r'<(/?)([a-zA-Z]+)[^>]*>')
+_PARTIAL_ENTITY_RE = re.compile(r'&#?[a-zA-Z0-9]*$')
+
+
+def truncate_html(text: str, limit: int) -> str:
+    """Cut Telegram HTML to at most `limit` chars without splitting a tag or entity.
+
+    Tags left open by the cut are closed, so the result still parses.
+    """
+    if len(text) <= limit:
+        return text
+    target = limit
+    while True:
+        cut = text[:target]
+        lt = cut.rfind('<')
+        if lt > cut.rfind('>'):
+            cut = cut[:lt]  # inside a tag
+        partial = _PARTIAL_ENTITY_RE.search(cut)
+        if partial:
+            cut = cut[:partial.start()]  # inside an entity (&amp; … &#x1F600;)
+        open_tags: List[str] = []
+        for closing, tag in _HTML_TAG_RE.findall(cut):
+            tag = tag.lower()
+            if not closing:
+                open_tags.append(tag)
+            elif tag in open_tags:
+                del open_tags[len(open_tags) - 1 - open_tags[::-1].index(tag)]
+        closers = ''.join(f'</{tag}>' for tag in reversed(open_tags))
+        if len(cut) + len(closers) <= limit:
+            return cut + closers
+        target = max(0, min(target - 1, limit - len(closers)))
+
+
 def format_job_message_legacy(job: Dict) -> str:
     """Legacy HTML formatter (fallback)"""
     level = job.get('level', 'Junior')
@@ -1587,7 +2367,7 @@ def format_job_message_legacy(job: Dict) -> str:
     if not url or not url.startswith('http'):
         url = 'https://example.com'
     
-    parts = [
+    head = "\n".join((
         f"{cat_emoji} <b>{title}</b>",
         "",
         f"🏢 <b>Компания:</b> {company}",
@@ -1597,84 +2377,114 @@ def format_job_message_legacy(job: Dict) -> str:
         f"📅 <b>Дата:</b> {posted_date} | {employment}",
         "",
         f"📋 <b>Описание:</b>",
-        description,
-        "",
-        "<b>🛠 Навыки:</b>"
-    ]
-    
+    ))
+    tail_parts = ["", "<b>🛠 Навыки:</b>"]
     if skills:
-        for skill in skills:
-            parts.append(f"  • {escape_html(skill)}")
+        tail_parts.extend(f"  • {escape_html(skill)}" for skill in skills)
     else:
-        parts.append("  Не указаны")
-    
-    parts.extend([
+        tail_parts.append("  Не указаны")
+    tail_parts.extend([
         "",
         f"🔗 <a href=\"{url}\">Откликнуться на вакансию</a>",
         f"📌 Источник: {source}"
     ])
-    
-    message = "\n".join(parts)
-    
-    if len(message) > 4096:
-        message = message[:4090] + "...\n<i>(сообщение сокращено)</i>"
-    
-    return message
+    tail = "\n".join(tail_parts)
+
+    # Only the description is trimmed to fit, so tags and the link always stay intact
+    budget = TELEGRAM_MESSAGE_LIMIT - len(head) - len(tail) - 2
+    if len(description) > budget:
+        marker = "...\n<i>(сообщение сокращено)</i>"
+        if budget < len(marker):
+            message = f"{head}\n{description}\n{tail}"
+            return truncate_html(message, TELEGRAM_MESSAGE_LIMIT - len(marker)) + marker
+        description = truncate_html(description, budget - len(marker)) + marker
+
+    return f"{head}\n{description}\n{tail}"
 
 # ==================== API FETCHERS ====================
+# url -> (etag, last_modified, parsed jobs); in-process, refilled after a restart
+_CONDITIONAL_CACHE: Dict[str, Tuple[str, str, List[Dict]]] = {}
+
+
+def fetch_jobs_conditional(url: str, parse_jobs, timeout: int = 15) -> List[Dict]:
+    """GET a JSON feed with If-None-Match/If-Modified-Since; on 304 reuse the last parsed jobs.
+
+    Callers get fresh dict copies: the pipeline mutates jobs (level, hash, caches).
+    """
+    headers = {}
+    cached = _CONDITIONAL_CACHE.get(url)
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    response = HTTP_SESSION.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        logger.debug(f"♻️ 304 Not Modified: {url}")
+        return [dict(job) for job in cached[2]]
+    response.raise_for_status()
+    jobs = parse_jobs(load_json(response))
+    etag = response.headers.get('ETag', '')
+    last_modified = response.headers.get('Last-Modified', '')
+    if etag or last_modified:
+        _CONDITIONAL_CACHE[url] = (etag, last_modified, [dict(job) for job in jobs])
+    return jobs
+
+
+def _parse_remotive(data) -> List[Dict]:
+    jobs = []
+    for job in data.get('jobs', []):
+        jobs.append({
+            'title': job.get('title', ''),
+            'company': job.get('company_name', ''),
+            'description': job.get('description', ''),
+            'url': job.get('url', ''),
+            'salary': job.get('salary', ''),
+            'location': job.get('candidate_required_location', 'Remote'),
+            'published': job.get('publication_date', ''),
+            'employment_type': job.get('job_type', ''),
+            'source': 'Remotive',
+            'tags': job.get('tags', [])
+        })
+    
+    return jobs
+
+
 def fetch_remotive() -> List[Dict]:
     """Remotive API - 100% remote"""
     try:
         url = "https://remotive.com/api/remote-jobs?category=software-dev"
-        response = requests.get(url, headers=get_headers(), timeout=15)
-        response.raise_for_status()
-        data = response.json()
-        
-        jobs = []
-        for job in data.get('jobs', []):
-            jobs.append({
-                'title': job.get('title', ''),
-                'company': job.get('company_name', ''),
-                'description': job.get('description', ''),
-                'url': job.get('url', ''),
-                'salary': job.get('salary', ''),
-                'location': job.get('candidate_required_location', 'Remote'),
-                'published': job.get('publication_date', ''),
-                'employment_type': job.get('job_type', ''),
-                'source': 'Remotive',
-                'tags': job.get('tags', [])
-            })
-        
-        return jobs
+        return fetch_jobs_conditional(url, _parse_remotive)
     except Exception as e:
         logger.error(f"❌ Remotive error: {e}")
         return []
 
 
-def fetch_remoteok() -> List[Dict]:
-    """RemoteOK API"""
-    try:
-        url = "https://remoteok.com/api"
-        response = requests.get(url, headers=get_headers(), timeout=15)
-        response.raise_for_status()
-        data = response.json()
-        
-        jobs = []
-        for job in data[1:]:
-            jobs.append({
-                'title': job.get('position', ''),
-                'company': job.get('company', ''),
-                'description': job.get('description', ''),
-                'url': job.get('url', ''),
-                'salary': job.get('salary', ''),
-                'location': job.get('location', 'Remote'),
-                'published': job.get('date', ''),
-                'employment_type': job.get('position_type', ''),
-                'source': 'RemoteOK',
-                'tags': job.get('tags', [])
-            })
-        
-        return jobs
+def _parse_remoteok(data) -> List[Dict]:
+    jobs = []
+    for job in data[1:]:
+        jobs.append({
+            'title': job.get('position', ''),
+            'company': job.get('company', ''),
+            'description': job.get('description', ''),
+            'url': job.get('url', ''),
+            'salary': job.get('salary', ''),
+            'location': job.get('location', 'Remote'),
+            'published': job.get('date', ''),
+            'employment_type': job.get('position_type', ''),
+            'source': 'RemoteOK',
+            'tags': job.get('tags', [])
+        })
+    
+    return jobs
+
+
+def fetch_remoteok() -> List[Dict]:
+    """RemoteOK API"""
+    try:
+        url = "https://remoteok.com/api"
+        return fetch_jobs_conditional(url, _parse_remoteok)
     except Exception as e:
         logger.error(f"❌ RemoteOK error: {e}")
         return []
@@ -1687,20 +2497,16 @@ def fetch_arbeitnow() -> List[Dict]:
         for page in range(1, 4):
             url = "https://www.arbeitnow.com/api/job-board-api"
             params = {'page': page, 'limit': 50, 'tags': 'it,software,developer,engineer'}
-            response = requests.get(url, params=params, headers=get_headers(), timeout=15)
+            response = HTTP_SESSION.get(url, params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = load_json(response)
 
             jobs = data.get('data', [])
             if not jobs:
                 break
 
             for job in jobs:
-                salary = 'Не указана'
-                if job.get('salary_min') and job.get('salary_max'):
-                    salary = f"${job['salary_min']:,}-${job['salary_max']:}"
-                elif job.get('salary_min'):
-                    salary = f"от ${job['salary_min']:,}"
+                salary = format_salary(job.get('salary_min'), job.get('salary_max'), symbol='$')
 
                 all_jobs.append({
                     'title': job.get('title', ''),
@@ -1734,19 +2540,18 @@ def fetch_himalayas() -> List[Dict]:
         for _ in range(3):
             url = "https://himalayas.app/jobs/api"
             params = {'limit': limit, 'offset': offset}
-            response = requests.get(url, params=params, headers=get_headers(), timeout=15)
+            response = HTTP_SESSION.get(url, params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = load_json(response)
 
             jobs = data.get('jobs', [])
             if not jobs:
                 break
 
             for job in jobs:
-                salary = 'Не указана'
-                if job.get('minSalary') and job.get('maxSalary'):
-                    currency = job.get('currency', 'USD')
-                    salary = f"{job['minSalary']:,}-{job['maxSalary']:,} {currency}"
+                if not has_it_title(job.get('title')):
+                    continue
+                salary = format_salary(job.get('minSalary'), job.get('maxSalary'), job.get('currency', 'USD'))
 
                 all_jobs.append({
                     'title': job.get('title', ''),
@@ -1776,14 +2581,16 @@ def fetch_weworkremotely() -> List[Dict]:
     """We Work Remotely RSS feed"""
     try:
         url = "https://weworkremotely.com/categories/remote-programming-jobs.rss"
-        headers = {**get_headers(), 'Accept': 'application/rss+xml, application/xml;q=0.9, */*;q=0.8'}
-        response = requests.get(url, headers=headers, timeout=15)
+        headers = {'Accept': 'application/rss+xml, application/xml;q=0.9, */*;q=0.8'}
+        response = HTTP_SESSION.get(url, headers=headers, timeout=15)
         response.raise_for_status()
         root = ET.fromstring(response.content)
         
         jobs = []
         for item in root.findall('.//item')[:30]:
             title = first_text(item, 'title')
+            if not has_it_title(title):
+                continue
             company = first_text(item, '{http://purl.org/dc/elements/1.1/}creator') or 'We Work Remotely'
             jobs.append({
                 'title': title,
@@ -1804,30 +2611,30 @@ def fetch_weworkremotely() -> List[Dict]:
         return []
 
 
+def _parse_jobicy(data) -> List[Dict]:
+    jobs = []
+    for job in data.get('jobs', []):
+        jobs.append({
+            'title': job.get('jobTitle', ''),
+            'company': job.get('companyName', ''),
+            'description': job.get('jobExcerpt', ''),
+            'url': job.get('url', ''),
+            'salary': '',
+            'location': job.get('jobGeo', 'Remote'),
+            'published': job.get('jobPosted', ''),
+            'employment_type': job.get('jobType', ''),
+            'source': 'Jobicy',
+            'tags': []
+        })
+    
+    return jobs
+
+
 def fetch_jobicy() -> List[Dict]:
     """Jobicy API"""
     try:
         url = "https://jobicy.com/api/v2/remote-jobs?count=50"
-        response = requests.get(url, headers=get_headers(), timeout=15)
-        response.raise_for_status()
-        data = response.json()
-        
-        jobs = []
-        for job in data.get('jobs', []):
-            jobs.append({
-                'title': job.get('jobTitle', ''),
-                'company': job.get('companyName', ''),
-                'description': job.get('jobExcerpt', ''),
-                'url': job.get('url', ''),
-                'salary': '',
-                'location': job.get('jobGeo', 'Remote'),
-                'published': job.get('jobPosted', ''),
-                'employment_type': job.get('jobType', ''),
-                'source': 'Jobicy',
-                'tags': []
-            })
-        
-        return jobs
+        return fetch_jobs_conditional(url, _parse_jobicy)
     except Exception as e:
         logger.error(f"❌ Jobicy error: {e}")
         return []
@@ -1836,12 +2643,14 @@ def fetch_jobicy() -> List[Dict]:
 def fetch_devitjobs() -> List[Dict]:
     """DevITJobs UK XML feed."""
     try:
-        response = requests.get("https://devitjobs.uk/job_feed.xml", headers=get_headers(), timeout=25)
+        response = HTTP_SESSION.get("https://devitjobs.uk/job_feed.xml", timeout=25)
         response.raise_for_status()
         root = ET.fromstring(response.content)
         jobs = []
         for item in root.findall('.//job')[:200]:
             title = first_text(item, 'title', 'name')
+            if not has_it_title(title):
+                continue
             description = strip_html(first_text(item, 'description'))
             location = first_text(item, 'location', 'region', 'country') or 'Remote'
             if 'remote' not in f"{title} {description} {location}".lower():
@@ -1867,27 +2676,25 @@ def fetch_devitjobs() -> List[Dict]:
 def fetch_hackernews() -> List[Dict]:
     """HN Algolia comments from latest Who is Hiring thread."""
     try:
-        story_resp = requests.get(
+        story_resp = HTTP_SESSION.get(
             "https://hn.algolia.com/api/v1/search_by_date",
             params={'query': 'remote', 'tags': 'story,author_whoishiring'},
-            headers=get_headers(),
             timeout=15
         )
         story_resp.raise_for_status()
-        stories = story_resp.json().get('hits', [])
+        stories = load_json(story_resp).get('hits', [])
         if not stories:
             return []
 
         story_id = stories[0].get('objectID')
-        response = requests.get(
+        response = HTTP_SESSION.get(
             "https://hn.algolia.com/api/v1/search_by_date",
             params={'query': 'remote', 'tags': f'comment,story_{story_id}', 'hitsPerPage': 50},
-            headers=get_headers(),
             timeout=15
         )
         response.raise_for_status()
         jobs = []
-        for hit in response.json().get('hits', []):
+        for hit in load_json(response).get('hits', []):
             text = strip_html(hit.get('comment_text', ''))
             if not text:
                 continue
@@ -1920,7 +2727,7 @@ def fetch_reed() -> List[Dict]:
         logger.warning("⚠️ Reed API key not found, skipping")
         return []
     try:
-        response = requests.get(
+        response = HTTP_SESSION.get(
             "https://www.reed.co.uk/api/1.0/search",
             auth=(Config.REED_API_KEY, ''),
             params={'keywords': 'junior middle software developer', 'location': 'remote', 'resultsToTake': 50},
@@ -1928,7 +2735,7 @@ def fetch_reed() -> List[Dict]:
         )
         response.raise_for_status()
         jobs = []
-        for item in response.json().get('results', []):
+        for item in load_json(response).get('results', []):
             salary = 'Не указана'
             if item.get('minimumSalary') or item.get('maximumSalary'):
                 salary = f"{item.get('minimumSalary') or 0:,.0f}-{item.get('maximumSalary') or 0:,.0f} GBP"
@@ -1956,15 +2763,14 @@ def fetch_jooble() -> List[Dict]:
         logger.warning("⚠️ Jooble API key not found, skipping")
         return []
     try:
-        response = requests.post(
+        response = HTTP_SESSION.post(
             f"https://jooble.org/api/v2/jobs/{Config.JOOBLE_API_KEY}",
             json={'keywords': 'junior middle developer remote', 'location': 'Remote', 'page': 1},
-            headers=get_headers(),
             timeout=15
         )
         response.raise_for_status()
         jobs = []
-        for item in response.json().get('jobs', []):
+        for item in load_json(response).get('jobs', []):
             jobs.append({
                 'title': item.get('title', ''),
                 'company': item.get('company', ''),
@@ -1989,14 +2795,14 @@ def fetch_findwork() -> List[Dict]:
         logger.warning("⚠️ FindWork token not found, skipping")
         return []
     try:
-        response = requests.get(
+        response = HTTP_SESSION.get(
             "https://findwork.dev/api/jobs/",
-            headers={'Authorization': f'Token {Config.FINDWORK_API_TOKEN}', **get_headers()},
+            headers={'Authorization': f'Token {Config.FINDWORK_API_TOKEN}'},
             params={'search': 'remote junior middle python developer'},
             timeout=15
         )
         response.raise_for_status()
-        data = response.json()
+        data = load_json(response)
         items = data.get('results', data if isinstance(data, list) else [])
         jobs = []
         for item in items:
@@ -2024,7 +2830,7 @@ def fetch_usajobs() -> List[Dict]:
         logger.warning("⚠️ USAJobs credentials not found, skipping")
         return []
     try:
-        response = requests.get(
+        response = HTTP_SESSION.get(
             "https://data.usajobs.gov/api/search",
             headers={
                 'Host': 'data.usajobs.gov',
@@ -2036,7 +2842,7 @@ def fetch_usajobs() -> List[Dict]:
         )
         response.raise_for_status()
         jobs = []
-        for item in response.json().get('SearchResult', {}).get('SearchResultItems', []):
+        for item in load_json(response).get('SearchResult', {}).get('SearchResultItems', []):
             desc = item.get('MatchedObjectDescriptor', {})
             salary = desc.get('PositionRemuneration', [{}])[0] if desc.get('PositionRemuneration') else {}
             jobs.append({
@@ -2057,57 +2863,53 @@ def fetch_usajobs() -> List[Dict]:
         return []
 
 
+def _fetch_adzuna_country(country: str) -> List[Dict]:
+    jobs = []
+    try:
+        url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/1"
+        params = {
+            'app_id': Config.ADZUNA_APP_ID,
+            'app_key': Config.ADZUNA_APP_KEY,
+            'results_per_page': 30,
+            'what': 'developer programmer engineer',
+            'where': 'remote',
+            'sort_by': 'date'
+        }
+        
+        response = HTTP_SESSION.get(url, params=params, timeout=15)
+        response.raise_for_status()
+        data = load_json(response)
+        
+        for job in data.get('results', []):
+            salary = format_salary(job.get('salary_min'), job.get('salary_max'), symbol='$')
+            
+            jobs.append({
+                'title': job.get('title', ''),
+                'company': job.get('company', {}).get('display_name', ''),
+                'description': job.get('description', ''),
+                'url': job.get('redirect_url', ''),
+                'salary': salary,
+                'location': job.get('location', {}).get('display_name', 'Remote'),
+                'published': job.get('created', ''),
+                'employment_type': job.get('contract_type', ''),
+                'source': 'Adzuna',
+                'tags': []
+            })
+    except Exception as e:
+        logger.error(f"❌ Adzuna {country} error: {e}")
+    return jobs
+
+
 def fetch_adzuna() -> List[Dict]:
-    """Adzuna API"""
+    """Adzuna API (countries fetched in parallel)"""
     try:
         if not Config.ADZUNA_APP_ID or not Config.ADZUNA_APP_KEY:
             logger.warning("⚠️ Adzuna API keys not found, skipping")
             return []
         
-        countries = ['us', 'gb']
         all_jobs = []
-        
-        for country in countries:
-            try:
-                url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/1"
-                params = {
-                    'app_id': Config.ADZUNA_APP_ID,
-                    'app_key': Config.ADZUNA_APP_KEY,
-                    'results_per_page': 30,
-                    'what': 'developer programmer engineer',
-                    'where': 'remote',
-                    'sort_by': 'date'
-                }
-                
-                response = requests.get(url, params=params, timeout=15)
-                response.raise_for_status()
-                data = response.json()
-                
-                for job in data.get('results', []):
-                    salary = 'Не указана'
-                    if job.get('salary_min') and job.get('salary_max'):
-                        salary = f"${job['salary_min']:,.0f}-${job['salary_max']:,.0f}"
-                    elif job.get('salary_min'):
-                        salary = f"от ${job['salary_min']:,.0f}"
-                    
-                    all_jobs.append({
-                        'title': job.get('title', ''),
-                        'company': job.get('company', {}).get('display_name', ''),
-                        'description': job.get('description', ''),
-                        'url': job.get('redirect_url', ''),
-                        'salary': salary,
-                        'location': job.get('location', {}).get('display_name', 'Remote'),
-                        'published': job.get('created', ''),
-                        'employment_type': job.get('contract_type', ''),
-                        'source': 'Adzuna',
-                        'tags': []
-                    })
-                
-                time.sleep(2)
-            except Exception as e:
-                logger.error(f"❌ Adzuna {country} error: {e}")
-                continue
-        
+        for country_jobs in map_concurrently(_fetch_adzuna_country, ['us', 'gb']):
+            all_jobs.extend(country_jobs)
         return all_jobs
     except Exception as e:
         logger.error(f"❌ Adzuna general error: {e}")
@@ -2139,7 +2941,7 @@ def fetch_headhunter() -> List[Dict]:
                 'search_field': ('name', 'description')
             }
 
-            response = requests.get(url, params=params, headers=headers, timeout=15)
+            response = HTTP_SESSION.get(url, params=params, headers=headers, timeout=15)
             if response.status_code == 403 and not Config.HEADHUNTER_ACCESS_TOKEN:
                 logger.warning(
                     "⚠️ HeadHunter /vacancies returned 403 without OAuth. "
@@ -2147,23 +2949,16 @@ def fetch_headhunter() -> List[Dict]:
                 )
                 return []
             response.raise_for_status()
-            data = response.json()
+            data = load_json(response)
             items = data.get('items', [])
             if not items:
                 break
 
             for item in items:
-                salary_info = item.get('salary')
-                salary = 'Не указана'
-
-                if salary_info:
-                    currency = salary_info.get('currency', 'RUB')
-                    if salary_info.get('from') and salary_info.get('to'):
-                        salary = f"{salary_info['from']:,}-{salary_info['to']:,} {currency}"
-                    elif salary_info.get('from'):
-                        salary = f"от {salary_info['from']:,} {currency}"
-                    elif salary_info.get('to'):
-                        salary = f"до {salary_info['to']:,} {currency}"
+                salary_info = item.get('salary') or {}
+                salary = format_salary(
+                    salary_info.get('from'), salary_info.get('to'), salary_info.get('currency', 'RUB')
+                )
 
                 snippet = item.get('snippet', {})
                 description = f"{snippet.get('requirement', '')} {snippet.get('responsibility', '')}"
@@ -2204,25 +2999,21 @@ def fetch_superjob() -> List[Dict]:
             return []
         
         url = "https://api.superjob.ru/2.0/vacancies/"
-        headers = {'X-Api-App-Id': Config.SUPERJOB_API_KEY, **get_headers()}
+        headers = {'X-Api-App-Id': Config.SUPERJOB_API_KEY}
         params = {'keyword': 'программист разработчик', 'count': 20}
         
-        response = requests.get(url, headers=headers, params=params, timeout=15)
+        response = HTTP_SESSION.get(url, headers=headers, params=params, timeout=15)
         
         if response.status_code == 403:
             logger.error("❌ SuperJob 403: Check API key in .env")
             return []
         
         response.raise_for_status()
-        data = response.json()
+        data = load_json(response)
         
         jobs = []
         for item in data.get('objects', []):
-            salary = 'Не указана'
-            if item.get('payment_from') and item.get('payment_to'):
-                salary = f"{item['payment_from']:,}-{item['payment_to']:,} RUB"
-            elif item.get('payment_from'):
-                salary = f"от {item['payment_from']:,} RUB"
+            salary = format_salary(item.get('payment_from'), item.get('payment_to'), 'RUB')
             
             employment_type = item.get('type_of_work', {})
             employment_name = employment_type.get('title', '') if isinstance(employment_type, dict) else ''
@@ -2246,100 +3037,121 @@ def fetch_superjob() -> List[Dict]:
         return []
 
 
+def _fetch_greenhouse_board(board: str) -> List[Dict]:
+    jobs = []
+    try:
+        response = HTTP_SESSION.get(
+            f"https://api.greenhouse.io/v1/boards/{board}/jobs",
+            params={'content': 'true'},
+            timeout=15
+        )
+        response.raise_for_status()
+        for item in load_json(response).get('jobs', []):
+            if not has_it_title(item.get('title')):
+                continue
+            offices = item.get('offices') or []
+            location = ', '.join([office.get('name', '') for office in offices if office.get('name')]) or 'Remote'
+            jobs.append({
+                'title': item.get('title', ''),
+                'company': board,
+                'description': strip_html(item.get('content', '')),
+                'url': item.get('absolute_url', ''),
+                'salary': 'Не указана',
+                'location': location,
+                'published': item.get('updated_at', ''),
+                'employment_type': '',
+                'source': f'Greenhouse:{board}',
+                'tags': [dept.get('name', '') for dept in item.get('departments', []) if dept.get('name')]
+            })
+    except Exception as e:
+        logger.error(f"❌ Greenhouse {board} error: {e}")
+    return jobs
+
+
 def fetch_greenhouse() -> List[Dict]:
-    """Greenhouse public boards for configured company tokens."""
+    """Greenhouse public boards for configured company tokens (boards fetched in parallel)."""
     jobs = []
-    for board in non_empty_csv(Config.GREENHOUSE_BOARDS):
-        try:
-            response = requests.get(
-                f"https://api.greenhouse.io/v1/boards/{board}/jobs",
-                params={'content': 'true'},
-                headers=get_headers(),
-                timeout=15
-            )
-            response.raise_for_status()
-            for item in response.json().get('jobs', []):
-                offices = item.get('offices') or []
-                location = ', '.join([office.get('name', '') for office in offices if office.get('name')]) or 'Remote'
-                jobs.append({
-                    'title': item.get('title', ''),
-                    'company': board,
-                    'description': strip_html(item.get('content', '')),
-                    'url': item.get('absolute_url', ''),
-                    'salary': 'Не указана',
-                    'location': location,
-                    'published': item.get('updated_at', ''),
-                    'employment_type': '',
-                    'source': f'Greenhouse:{board}',
-                    'tags': [dept.get('name', '') for dept in item.get('departments', []) if dept.get('name')]
-                })
-        except Exception as e:
-            logger.error(f"❌ Greenhouse {board} error: {e}")
+    for board_jobs in map_concurrently(_fetch_greenhouse_board, non_empty_csv(Config.GREENHOUSE_BOARDS)):
+        jobs.extend(board_jobs)
+    return jobs
+
+
+def _fetch_lever_board(company: str) -> List[Dict]:
+    jobs = []
+    try:
+        response = HTTP_SESSION.get(
+            f"https://api.lever.co/v0/postings/{company}",
+            params={'mode': 'json'},
+            timeout=15
+        )
+        response.raise_for_status()
+        for item in load_json(response):
+            if not has_it_title(item.get('text')):
+                continue
+            categories = item.get('categories') or {}
+            location = categories.get('location', 'Remote')
+            workplace_type = item.get('workplaceType') or item.get('workplace_type') or ''
+            if str(workplace_type).lower() == 'remote' and 'remote' not in location.lower():
+                location = f"{location}, Remote" if location else 'Remote'
+            jobs.append({
+                'title': item.get('text', ''),
+                'company': company,
+                'description': strip_html(item.get('descriptionPlain', '') or item.get('description', '')),
+                'url': item.get('hostedUrl', '') or item.get('applyUrl', ''),
+                'salary': 'Не указана',
+                'location': location,
+                'published': str(item.get('createdAt', '')),
+                'employment_type': categories.get('commitment', ''),
+                'source': f'Lever:{company}',
+                'tags': [categories.get('team', '')] if categories.get('team') else []
+            })
+    except Exception as e:
+        logger.error(f"❌ Lever {company} error: {e}")
     return jobs
 
 
 def fetch_lever() -> List[Dict]:
-    """Lever public postings for configured company IDs."""
+    """Lever public postings for configured company IDs (fetched in parallel)."""
     jobs = []
-    for company in non_empty_csv(Config.LEVER_COMPANIES):
-        try:
-            response = requests.get(
-                f"https://api.lever.co/v0/postings/{company}",
-                params={'mode': 'json'},
-                headers=get_headers(),
-                timeout=15
-            )
-            response.raise_for_status()
-            for item in response.json():
-                categories = item.get('categories') or {}
-                location = categories.get('location', 'Remote')
-                workplace_type = item.get('workplaceType') or item.get('workplace_type') or ''
-                if str(workplace_type).lower() == 'remote' and 'remote' not in location.lower():
-                    location = f"{location}, Remote" if location else 'Remote'
-                jobs.append({
-                    'title': item.get('text', ''),
-                    'company': company,
-                    'description': strip_html(item.get('descriptionPlain', '') or item.get('description', '')),
-                    'url': item.get('hostedUrl', '') or item.get('applyUrl', ''),
-                    'salary': 'Не указана',
-                    'location': location,
-                    'published': str(item.get('createdAt', '')),
-                    'employment_type': categories.get('commitment', ''),
-                    'source': f'Lever:{company}',
-                    'tags': [categories.get('team', '')] if categories.get('team') else []
-                })
-        except Exception as e:
-            logger.error(f"❌ Lever {company} error: {e}")
+    for board_jobs in map_concurrently(_fetch_lever_board, non_empty_csv(Config.LEVER_COMPANIES)):
+        jobs.extend(board_jobs)
+    return jobs
+
+
+def _fetch_ashby_board(company: str) -> List[Dict]:
+    jobs = []
+    try:
+        response = HTTP_SESSION.get(
+            f"https://api.ashbyhq.com/posting-api/job-board/{company}",
+            timeout=20
+        )
+        response.raise_for_status()
+        for item in load_json(response).get('jobs', []):
+            if not has_it_title(item.get('title')):
+                continue
+            location = item.get('locationName') or item.get('location', 'Remote')
+            jobs.append({
+                'title': item.get('title', ''),
+                'company': company,
+                'description': strip_html(item.get('descriptionHtml', '') or item.get('descriptionPlain', '')),
+                'url': item.get('jobUrl', '') or item.get('applyUrl', ''),
+                'salary': item.get('compensation', '') or 'Не указана',
+                'location': location,
+                'published': item.get('publishedAt', ''),
+                'employment_type': item.get('employmentType', ''),
+                'source': f'Ashby:{company}',
+                'tags': [item.get('department', '')] if item.get('department') else []
+            })
+    except Exception as e:
+        logger.error(f"❌ Ashby {company} error: {e}")
     return jobs
 
 
 def fetch_ashby() -> List[Dict]:
-    """Ashby public job boards for configured company names."""
+    """Ashby public job boards for configured company names (fetched in parallel)."""
     jobs = []
-    for company in non_empty_csv(Config.ASHBY_COMPANIES):
-        try:
-            response = requests.get(
-                f"https://api.ashbyhq.com/posting-api/job-board/{company}",
-                headers=get_headers(),
-                timeout=20
-            )
-            response.raise_for_status()
-            for item in response.json().get('jobs', []):
-                location = item.get('locationName') or item.get('location', 'Remote')
-                jobs.append({
-                    'title': item.get('title', ''),
-                    'company': company,
-                    'description': strip_html(item.get('descriptionHtml', '') or item.get('descriptionPlain', '')),
-                    'url': item.get('jobUrl', '') or item.get('applyUrl', ''),
-                    'salary': item.get('compensation', '') or 'Не указана',
-                    'location': location,
-                    'published': item.get('publishedAt', ''),
-                    'employment_type': item.get('employmentType', ''),
-                    'source': f'Ashby:{company}',
-                    'tags': [item.get('department', '')] if item.get('department') else []
-                })
-        except Exception as e:
-            logger.error(f"❌ Ashby {company} error: {e}")
+    for board_jobs in map_concurrently(_fetch_ashby_board, non_empty_csv(Config.ASHBY_COMPANIES)):
+        jobs.extend(board_jobs)
     return jobs
 
 
@@ -2349,17 +3161,18 @@ def fetch_apify_actor_jobs(actor_id: str, source_name: str, payload: Dict) -> Li
         logger.warning(f"⚠️ Apify token not found, skipping {source_name}")
         return []
     try:
-        response = requests.post(
+        response = HTTP_SESSION.post(
             f"https://api.apify.com/v2/acts/{actor_id}/run-sync-get-dataset-items",
             params={'token': Config.APIFY_API_TOKEN, 'clean': 'true'},
             json=payload,
-            headers=get_headers(),
             timeout=90
         )
         response.raise_for_status()
         jobs = []
-        for item in response.json():
+        for item in load_json(response):
             title = item.get('title') or item.get('jobTitle') or item.get('position') or ''
+            if not has_it_title(title):
+                continue
             company = item.get('company') or item.get('companyName') or item.get('organization') or ''
             url = item.get('url') or item.get('jobUrl') or item.get('applyUrl') or item.get('link') or ''
             description = item.get('description') or item.get('jobDescription') or item.get('text') or ''
@@ -2396,16 +3209,15 @@ def fetch_apify_usajobs() -> List[Dict]:
             'sortField': 'opendate',
             'sortDirection': 'Desc',
         }
-        response = requests.post(
+        response = HTTP_SESSION.post(
             "https://api.apify.com/v2/acts/parseforge~usajobs-scraper/run-sync-get-dataset-items",
             params={'token': Config.APIFY_API_TOKEN, 'clean': 'true'},
             json=payload,
-            headers=get_headers(),
             timeout=120
         )
         response.raise_for_status()
         jobs = []
-        for item in response.json():
+        for item in load_json(response):
             salary = 'Не указана'
             if item.get('salaryMin') or item.get('salaryMax'):
                 salary = (
@@ -2451,16 +3263,15 @@ def fetch_apify_all_jobs() -> List[Dict]:
             'job_type': 'all',
             'currency': 'USD',
         }
-        response = requests.post(
+        response = HTTP_SESSION.post(
             "https://api.apify.com/v2/acts/agentx~all-jobs-scraper/run-sync-get-dataset-items",
             params={'token': Config.APIFY_API_TOKEN, 'clean': 'true'},
             json=payload,
-            headers=get_headers(),
             timeout=180
         )
         response.raise_for_status()
         jobs = []
-        for item in response.json():
+        for item in load_json(response):
             if item.get('is_remote') is False and item.get('work_from_home') is False:
                 continue
             salary = 'Не указана'
@@ -2599,7 +3410,7 @@ async def get_recent_channel_job_hashes(limit: Optional[int] = None) -> set:
                             if url:
                                 urls.append(url)
                 for url in urls:
-                    hashes.add(hashlib.sha256(normalize_url(url).encode()).hexdigest()[:16])
+                    hashes.add(url_hash(normalize_url(url)))
         finally:
             await parser.disconnect()
         logger.info(f"🔎 Loaded {len(hashes)} recent channel job hashes")
@@ -2622,36 +3433,104 @@ def get_target_channels(job: Dict) -> List[str]:
     return [Config.CHANNEL_ID] if Config.CHANNEL_ID else []
 
 
-async def _send_job_to_chat(bot: Bot, job: Dict, chat_id: str) -> bool:
-    """Low-level send one job message to one chat."""
-    try:
-        if Config.ENABLE_MARKDOWN_V2 and FORMATTER_AVAILABLE:
-            formatter = JobMessageFormatter()
-            formatted = formatter.format_job(
-                job, view_mode='compact', bot_username=Config.BOT_USERNAME
-            )
-            await bot.send_message(
-                chat_id=chat_id,
-                text=formatted.text,
-                parse_mode=ParseMode.MARKDOWN_V2,
-                reply_markup=InlineKeyboardMarkup(formatted.reply_markup['inline_keyboard']),
-                disable_web_page_preview=formatted.disable_web_page_preview
-            )
-        else:
-            await bot.send_message(
-                chat_id=chat_id,
-                text=format_job_message_legacy(job),
-                parse_mode='HTML',
-                disable_web_page_preview=True
+class TokenBucket:
+    """Async token bucket: bursts of up to `capacity` sends, then one per period/capacity.
+
+    Slots are reserved synchronously (no lock), so one instance is safe to share
+    across coroutines and across the event loops of successive serverless runs.
+    """
+
+    def __init__(self, capacity: int, period: float):
+        capacity = max(1, capacity)
+        self._interval = period / capacity
+        self._burst = period - self._interval
+        self._tat = 0.0  # theoretical arrival time of the next send (monotonic)
+
+    def reserve(self) -> float:
+        """Claim the next slot and return how long to wait before using it."""
+        now = time.monotonic()
+        tat = max(self._tat, now)
+        self._tat = tat + self._interval
+        return max(0.0, tat - self._burst - now)
+
+    def hold(self, seconds: float) -> None:
+        """Drain the bucket so no slot is granted for `seconds` (Telegram flood wait)."""
+        self._tat = max(self._tat, time.monotonic() + seconds + self._burst)
+
+
+class TelegramSendLimiter:
+    """Global + per-chat token buckets in front of every channel post."""
+
+    def __init__(self, global_per_sec: int, chat_per_min: int):
+        self._global = TokenBucket(global_per_sec, 1.0)
+        self._chat_per_min = chat_per_min
+        self._chats: Dict[str, TokenBucket] = {}
+
+    def _chat(self, chat_id) -> TokenBucket:
+        bucket = self._chats.get(str(chat_id))
+        if bucket is None:
+            bucket = self._chats[str(chat_id)] = TokenBucket(self._chat_per_min, 60.0)
+        return bucket
+
+    async def wait(self, chat_id) -> None:
+        delay = max(self._global.reserve(), self._chat(chat_id).reserve())
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def flood_wait(self, chat_id, seconds: float) -> None:
+        self._chat(chat_id).hold(seconds)
+
+
+TELEGRAM_LIMITER = TelegramSendLimiter(Config.TELEGRAM_GLOBAL_MSGS_PER_SEC, Config.TELEGRAM_CHAT_MSGS_PER_MIN)
+
+
+def build_telegram_request() -> HTTPXRequest:
+    """Bot API transport for the bare serverless Bot (PTB's plain-Bot default is 1 connection, 1 s wait)."""
+    return HTTPXRequest(
+        connection_pool_size=Config.TELEGRAM_POOL_SIZE,
+        pool_timeout=Config.TELEGRAM_POOL_TIMEOUT,
+    )
+
+
+def render_job_message(job: Dict, formatter: Optional["JobMessageFormatter"] = None) -> Dict:
+    """send_message kwargs for a channel post; rendered once per job, reused for every chat and retry."""
+    if Config.ENABLE_MARKDOWN_V2 and FORMATTER_AVAILABLE:
+        formatted = (formatter or JobMessageFormatter()).format_job(
+            job, view_mode='compact', bot_username=Config.BOT_USERNAME
+        )
+        return {
+            'text': formatted.text,
+            'parse_mode': ParseMode.MARKDOWN_V2,
+            'reply_markup': InlineKeyboardMarkup(formatted.reply_markup['inline_keyboard']),
+            'disable_web_page_preview': formatted.disable_web_page_preview,
+        }
+    return {
+        'text': format_job_message_legacy(job),
+        'parse_mode': 'HTML',
+        'disable_web_page_preview': True,
+    }
+
+
+async def _send_job_to_chat(bot: Bot, message: Dict, chat_id: str) -> bool:
+    """Low-level send of a rendered job message to one chat (bounded retries on flood control)."""
+    attempts = Config.TELEGRAM_FLOOD_RETRIES + 1
+    for attempt in range(1, attempts + 1):
+        await TELEGRAM_LIMITER.wait(chat_id)
+        try:
+            await bot.send_message(chat_id=chat_id, **message)
+            return True
+        except RetryAfter as e:
+            logger.warning(
+                f"⏳ Flood control {chat_id}: retry after {e.retry_after}s ({attempt}/{attempts})"
             )
-        return True
-    except RetryAfter as e:
-        logger.warning(f"⏳ Flood control {chat_id}: retry after {e.retry_after}s")
-        await asyncio.sleep(e.retry_after)
-        return await _send_job_to_chat(bot, job, chat_id)
-    except Exception as e:
-        logger.error(f"❌ Send fail → {chat_id}: {e}")
-        return False
+            # The chat bucket absorbs retry_after; jitter keeps parallel senders from waking together
+            TELEGRAM_LIMITER.flood_wait(chat_id, e.retry_after)
+            await asyncio.sleep(random.uniform(0, 0.5))
+        except Exception as e:
+            logger.error(f"❌ Send fail → {chat_id}: {e}")
+            return False
+    logger.error(f"❌ Send fail → {chat_id}: flood control after {attempts} attempts")
+    return False
 
 
 async def post_job_with_bot(bot: Bot, job: Dict, db: Optional[DatabaseConnection] = None) -> bool:
@@ -2665,12 +3544,17 @@ async def post_job_with_bot(bot: Bot, job: Dict, db: Optional[DatabaseConnection
     if not targets:
         logger.error("❌ No target channels for job")
         return False
+    try:
+        message = render_job_message(job)
+    except Exception as e:
+        logger.error(f"❌ Format fail: {job.get('title', 'N/A')}: {e}")
+        return False
 
     any_ok = False
     for i, chat_id in enumerate(targets):
         if i > 0:
             await asyncio.sleep(Config.MULTI_TRACK_POST_DELAY)
-        ok = await _send_job_to_chat(bot, job, chat_id)
+        ok = await _send_job_to_chat(bot, message, chat_id)
         if ok:
             any_ok = True
             logger.info(
@@ -2695,6 +3579,7 @@ async def post_job_with_telethon(job: Dict) -> bool:
             return False
         entity = await parser.client.get_entity(Config.CHANNEL_ID)
         text = format_job_message_legacy(job)
+        await TELEGRAM_LIMITER.wait(Config.CHANNEL_ID)
         await parser.client.send_message(
             entity,
             text,
@@ -2748,7 +3633,7 @@ async def collect_and_post_once(use_sqlite: bool = True, source_budget_seconds:
     bot = None
     post_transport = 'bot'
     if Config.TELEGRAM_BOT_TOKEN:
-        bot = Bot(Config.TELEGRAM_BOT_TOKEN)
+        bot = Bot(Config.TELEGRAM_BOT_TOKEN, request=build_telegram_request())
     else:
         post_transport = 'telethon'
 
@@ -2774,41 +3659,35 @@ async def collect_and_post_once(use_sqlite: bool = True, source_budget_seconds:
                 'transport': post_transport,
             }
 
-    started = time.monotonic()
-    all_jobs = []
     source_results = []
 
-    try:
-        for fetch_func, source_name in get_api_fetch_functions():
-            if source_budget_seconds and time.monotonic() - started > source_budget_seconds:
-                logger.warning(f"⏱️ Source budget exceeded, stopping before {source_name}")
-                break
-            jobs = safe_fetch_with_retry(fetch_func, source_name, max_retries=1)
-            all_jobs.extend(jobs)
-            source_results.append({'source': source_name, 'fetched': len(jobs)})
-            logger.info(f"📥 Fetched {len(jobs)} jobs from {source_name}")
+    async def fetch_telegram_within_budget() -> List[Dict]:
+        if not Config.ENABLE_TELEGRAM_CHANNELS:
+            return []
+        try:
+            tg_jobs = await asyncio.wait_for(fetch_telegram_channels(), timeout=source_budget_seconds or None)
+        except asyncio.TimeoutError:
+            logger.warning("⏱️ Source budget exceeded, skipping Telegram channels")
+            source_results.append({'source': 'Telegram channels', 'fetched': 0, 'timed_out': True})
+            return []
+        source_results.append({'source': 'Telegram channels', 'fetched': len(tg_jobs)})
+        return tg_jobs
 
-        if Config.ENABLE_TELEGRAM_CHANNELS:
-            if source_budget_seconds and time.monotonic() - started > source_budget_seconds:
-                logger.warning("⏱️ Source budget exceeded before Telegram channels")
-            else:
-                tg_jobs = await fetch_telegram_channels()
-                all_jobs.extend(tg_jobs)
-                source_results.append({'source': 'Telegram channels', 'fetched': len(tg_jobs)})
+    try:
+        # All sources at once: the cycle takes max(source latency), cut off at the budget
+        api_jobs, tg_jobs = await asyncio.gather(
+            fetch_api_sources_within_budget(
+                get_api_fetch_functions(),
+                timeout=source_budget_seconds or None,
+                source_results=source_results,
+            ),
+            fetch_telegram_within_budget(),
+        )
+        all_jobs = api_jobs + tg_jobs
 
-        classified_jobs = []
-        for job in all_jobs:
-            if GROWTH_UTILS_AVAILABLE:
-                normalize_job_title_company(job)
-            if not is_suitable_job(job):
-                continue
-            level = classify_job_level(job)
-            if not level:
-                continue
-            job['level'] = level
-            job['category'] = auto_classify_category(job)
-            job['hash'] = generate_job_hash(job)
-            classified_jobs.append(job)
+        fetched_count = len(all_jobs)
+        prepare_stats: Dict[str, int] = {}
+        classified_jobs = prepare_candidates(all_jobs, stats=prepare_stats)
 
         # Deduplication: always load recent hashes from channel history on serverless
         # (where SQLite is unavailable) to prevent reposting across cron invocations.
@@ -2820,18 +3699,16 @@ async def collect_and_post_once(use_sqlite: bool = True, source_budget_seconds:
 
         publish_candidates = []
         duplicate_count = failed_count = 0
+        known_hashes = None
+        if db:
+            purge_expired_jobs(db)
+            known_hashes = db.get_existing_hashes([job['hash'] for job in classified_jobs])
         recent_fps = db.recent_fingerprints(Config.FUZZY_DEDUP_LOOKBACK) if db else []
         for job in classified_jobs:
-            if GROWTH_UTILS_AVAILABLE:
-                enrich_job_salary_fields(job)
-                if not passes_min_salary(job, Config.GLOBAL_MIN_SALARY_USD):
-                    continue
-                if not passes_channel_tracks(job, Config.CHANNEL_TRACKS):
-                    continue
             if job.get('hash') in recent_hashes:
                 duplicate_count += 1
                 continue
-            if db and is_duplicate_job(job, db, recent_fps=recent_fps):
+            if db and is_duplicate_job(job, db, recent_fps=recent_fps, known_hashes=known_hashes):
                 duplicate_count += 1
                 continue
             publish_candidates.append(job)
@@ -2843,8 +3720,7 @@ async def collect_and_post_once(use_sqlite: bool = True, source_budget_seconds:
         if Config.ENABLE_SOURCE_DIVERSIFY:
             selected_jobs = diversify_jobs_by_source(publish_candidates, Config.MAX_POSTS_PER_CYCLE)
         else:
-            publish_candidates.sort(key=job_quality_score, reverse=True)
-            selected_jobs = publish_candidates[:Config.MAX_POSTS_PER_CYCLE]
+            selected_jobs = heapq.nlargest(Config.MAX_POSTS_PER_CYCLE, publish_candidates, key=job_quality_score)
         logger.info(
             f"🎯 Отобрано {len(selected_jobs)}/{total_selected} вакансий "
             f"(лимит {Config.MAX_POSTS_PER_CYCLE}, diversify={Config.ENABLE_SOURCE_DIVERSIFY})"
@@ -2860,24 +3736,33 @@ async def collect_and_post_once(use_sqlite: bool = True, source_budget_seconds:
         logger.info(f"📊 Posting by source: {selected_sources}")
 
         posted_count = 0
-        for job in selected_jobs:
-            if bot:
-                posted = await post_job_with_bot(bot, job, db=db)
-            else:
-                posted = await post_job_with_telethon(job)
-            if posted:
-                if db:
-                    register_posted_job(job, db)
-                    db.save_job_payload(job.get('hash') or generate_job_hash(job), job)
-                recent_hashes.add(job.get('hash'))
-                posted_count += 1
-                await asyncio.sleep(DELAYS['between_posts'])
-            else:
-                failed_count += 1
+        posted_jobs: List[Dict] = []
+        try:
+            for job in selected_jobs:
+                if bot:
+                    posted = await post_job_with_bot(bot, job, db=db)
+                else:
+                    posted = await post_job_with_telethon(job)
+                if posted:
+                    posted_jobs.append(job)
+                    recent_hashes.add(job.get('hash'))
+                    posted_count += 1
+                else:
+                    failed_count += 1
+        finally:
+            # One commit for the whole run, even if the invocation is cut short
+            if db and posted_jobs:
+                with db.transaction():
+                    register_posted_jobs(posted_jobs, db)
+                    if not bot:  # post_job_with_bot already stored payloads before sending
+                        for job in posted_jobs:
+                            db.save_job_payload(job['hash'], job)
 
         return {
             'ok': True,
-            'fetched': len(all_jobs),
+            'fetched': fetched_count,
+            'unique': fetched_count - prepare_stats['cross_listed'],
+            'cross_listed': prepare_stats['cross_listed'],
             'suitable': len(classified_jobs),
             'candidates': len(publish_candidates),
             'posted': posted_count,
@@ -2892,6 +3777,14 @@ async def collect_and_post_once(use_sqlite: bool = True, source_budget_seconds:
             db.close()
 
 # ==================== TELEGRAM BOT ====================
+STATUS_TMPL = (
+    "📊 <b>Статистика бота:</b>\n\n"
+    "✅ Всего опубликовано: {}\n"
+    "⏸️ Статус: {}\n"
+    "🕐 Обновление: {}"
+)
+
+
 class JobBot:
     """Telegram bot with enhanced features"""
     
@@ -2901,6 +3794,8 @@ class JobBot:
         self.is_paused = False
         self.formatter = JobMessageFormatter() if FORMATTER_AVAILABLE else None
         self.classifier = JobClassifier() if CLASSIFIER_AVAILABLE else None
+        # Config is fixed for the process lifetime: build the fetcher list once
+        self.api_fetch_functions = tuple(get_api_fetch_functions())
         # /setup conversation: user_id -> step
         self.setup_steps: Dict[int, str] = {}
     
@@ -3189,7 +4084,7 @@ class JobBot:
         """Admin: last crawl source health + configured fetcher list."""
         if not await self.check_admin(update):
             return
-        names = [n for _, n in get_api_fetch_functions()]
+        names = [n for _, n in self.api_fetch_functions]
         header = (
             f"Configured fetchers ({len(names)}):\n"
             + ", ".join(names[:40])
@@ -3223,7 +4118,8 @@ class JobBot:
         """Send matched jobs to user DM. Returns count sent."""
         settings = self._effective_profile(user_id)
         limit = self._digest_limit(settings)
-        jobs = self.db.recent_jobs_for_digest(
+        jobs = await asyncio.to_thread(
+            self.db.recent_jobs_for_digest,
             hours=Config.PERSONAL_DIGEST_LOOKBACK_HOURS,
             limit=80,
         )
@@ -3338,7 +4234,7 @@ class JobBot:
         """Channel content magnet: salary medians by category."""
         if not GROWTH_UTILS_AVAILABLE:
             return False
-        jobs = self.db.jobs_with_salary_for_report(days=14, limit=500)
+        jobs = await asyncio.to_thread(self.db.jobs_with_salary_for_report, days=14, limit=500)
         text = build_salary_magnet_report(jobs, category_names=CATEGORY_NAMES_RU)
         if Config.BOT_USERNAME:
             text += f"\n\nБот: https://t.me/{Config.BOT_USERNAME}?start=invite"
@@ -3401,20 +4297,16 @@ class JobBot:
         if not await self.check_admin(update):
             return
         
-        result = self.db.fetchone('SELECT COUNT(*) FROM posted_jobs')
-        total_posted = result[0] if result else 0
-        
-        # Count by category
-        cat_results = self.db.fetchall(
-            'SELECT category, COUNT(*) FROM posted_jobs GROUP BY category'
-        )
-        categories = {row[0]: row[1] for row in cat_results}
+        # Maintained in memory by the DB layer: no COUNT(*) scan per /status; the first
+        # call still runs one GROUP BY, so keep it off the event loop
+        categories = await asyncio.to_thread(self.db.posted_counts_by_category)
+        total_posted = sum(categories.values())
         
         stats = {
             'total_jobs': total_posted,
-            'total_sources': len(get_api_fetch_functions()) + (10 if Config.ENABLE_TELEGRAM_CHANNELS else 0),
+            'total_sources': len(self.api_fetch_functions) + (10 if Config.ENABLE_TELEGRAM_CHANNELS else 0),
             'is_paused': self.is_paused,
-            'last_update': datetime.now().strftime('%Y-%m-%d %H:%M'),
+            'last_update': datetime.now().isoformat(sep=' ', timespec='minutes'),
             'categories': categories,
         }
         
@@ -3425,31 +4317,45 @@ class JobBot:
                 parse_mode=ParseMode.MARKDOWN_V2
             )
         else:
-            message = (
-                "📊 <b>Статистика бота:</b>\n\n"
-                f"✅ Всего опубликовано: {total_posted}\n"
-                f"⏸️ Статус: {'Приостановлен' if self.is_paused else 'Активен'}\n"
-                f"🕐 Обновление: {stats['last_update']}"
+            message = STATUS_TMPL.format(
+                total_posted,
+                'Приостановлен' if self.is_paused else 'Активен',
+                stats['last_update'],
             )
             await update.message.reply_text(message, parse_mode='HTML')
     
     async def cmd_last(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /last N command"""
+        """Handle /last [N] [source|level] command"""
         if not await self.check_admin(update):
             return
         
+        # /last [N] [source|junior|middle]
         limit = 5
-        if context.args:
+        args = list(context.args or [])
+        if args:
             try:
-                limit = int(context.args[0])
-                limit = max(1, min(limit, 20))
+                limit = max(1, min(int(args[0]), 20))
+                args = args[1:]
             except ValueError:
                 pass
         
-        results = self.db.fetchall(
+        # Filter in SQL so only the requested rows leave SQLite
+        where, params = '', ()
+        filter_arg = ' '.join(args).strip()
+        if filter_arg.lower() in ('junior', 'middle'):
+            where, params = 'WHERE level = ? ', (filter_arg.capitalize(),)
+        elif filter_arg:
+            # Literal match (LIKE only for case-insensitivity); the family also matches
+            # its sub-sources ("Greenhouse" -> "Greenhouse:gitlab")
+            literal = filter_arg.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            where = "WHERE source LIKE ? ESCAPE '\\' OR source LIKE ? ESCAPE '\\' "
+            params = (literal, f"{literal}:%")
+        
+        results = await asyncio.to_thread(
+            self.db.fetchall,
             'SELECT title, company, level, category, posted_at, source FROM posted_jobs '
-            'ORDER BY posted_at DESC LIMIT ?',
-            (limit,)
+            + where + 'ORDER BY posted_at DESC LIMIT ?',
+            params + (limit,)
         )
         
         if not results:
@@ -3473,16 +4379,15 @@ class JobBot:
                 parse_mode=ParseMode.MARKDOWN_V2
             )
         else:
-            message = f"🆕 <b>Последние {len(results)} вакансий:</b>\n\n"
-            for row in results:
-                title, company, level, category, posted_at, source = row
-                message += f"• {escape_html(title)}\n  🏢 {escape_html(company)} | 🎯 {level}\n\n"
-            await update.message.reply_text(message, parse_mode='HTML')
+            parts = [f"🆕 <b>Последние {len(results)} вакансий:</b>\n\n"]
+            for title, company, level, category, posted_at, source in results:
+                parts.append(f"• {escape_html(title)}\n  🏢 {escape_html(company)} | 🎯 {level}\n\n")
+            await update.message.reply_text("".join(parts), parse_mode='HTML')
     
     async def cmd_favorites(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /favorites command"""
         user_id = update.effective_user.id
-        favorites = self.db.get_user_favorites(user_id)
+        favorites = await asyncio.to_thread(self.db.get_user_favorites, user_id)
         
         if self.formatter:
             message = self.formatter.format_favorites_list(favorites)
@@ -3494,10 +4399,10 @@ class JobBot:
             if not favorites:
                 await update.message.reply_text("💾 Список избранного пуст")
             else:
-                message = f"💾 <b>Избранное ({len(favorites)}):</b>\n\n"
+                parts = [f"💾 <b>Избранное ({len(favorites)}):</b>\n\n"]
                 for job in favorites[:10]:
-                    message += f"• {escape_html(job['title'])}\n  🏢 {escape_html(job['company'])}\n\n"
-                await update.message.reply_text(message, parse_mode='HTML')
+                    parts.append(f"• {escape_html(job['title'])}\n  🏢 {escape_html(job['company'])}\n\n")
+                await update.message.reply_text("".join(parts), parse_mode='HTML')
     
     async def cmd_categories(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /categories command"""
@@ -3678,68 +4583,38 @@ class JobBot:
             logger.error("❌ No target channels for job")
             return False
 
+        try:
+            message = render_job_message(job, self.formatter)
+        except Exception as e:
+            logger.error(f"❌ Format fail: {job.get('title', 'N/A')}: {e}")
+            return False
+
+        # AIORateLimiter retries 429s itself; without it, retry once after retry_after here
+        attempts = 1 if RATE_LIMITER_AVAILABLE else 2
         any_ok = False
         for i, chat_id in enumerate(targets):
             if i > 0:
                 await asyncio.sleep(Config.MULTI_TRACK_POST_DELAY)
-            try:
-                if Config.ENABLE_MARKDOWN_V2 and self.formatter:
-                    formatted = self.formatter.format_job(
-                        job, view_mode='compact', bot_username=Config.BOT_USERNAME
-                    )
-                    await self.application.bot.send_message(
-                        chat_id=chat_id,
-                        text=formatted.text,
-                        parse_mode=ParseMode.MARKDOWN_V2,
-                        reply_markup=InlineKeyboardMarkup(
-                            formatted.reply_markup['inline_keyboard']
-                        ),
-                        disable_web_page_preview=formatted.disable_web_page_preview
-                    )
-                else:
-                    await self.application.bot.send_message(
-                        chat_id=chat_id,
-                        text=format_job_message_legacy(job),
-                        parse_mode='HTML',
-                        disable_web_page_preview=True
-                    )
-                any_ok = True
-                logger.info(
-                    f"✅ Posted → {chat_id}: {job.get('title', 'N/A')} "
-                    f"[{job.get('category', 'other')}]"
-                )
-            except RetryAfter as e:
-                logger.warning(f"⏳ Flood control {chat_id}: {e.retry_after}s")
-                await asyncio.sleep(e.retry_after)
+            for attempt in range(1, attempts + 1):
+                await TELEGRAM_LIMITER.wait(chat_id)
                 try:
-                    # one retry after flood wait
-                    if Config.ENABLE_MARKDOWN_V2 and self.formatter:
-                        formatted = self.formatter.format_job(
-                            job, view_mode='compact', bot_username=Config.BOT_USERNAME
-                        )
-                        await self.application.bot.send_message(
-                            chat_id=chat_id,
-                            text=formatted.text,
-                            parse_mode=ParseMode.MARKDOWN_V2,
-                            reply_markup=InlineKeyboardMarkup(
-                                formatted.reply_markup['inline_keyboard']
-                            ),
-                            disable_web_page_preview=True,
-                        )
-                    else:
-                        await self.application.bot.send_message(
-                            chat_id=chat_id,
-                            text=format_job_message_legacy(job),
-                            parse_mode='HTML',
-                            disable_web_page_preview=True,
-                        )
+                    await self.application.bot.send_message(chat_id=chat_id, **message)
                     any_ok = True
-                except Exception as e2:
-                    logger.error(f"❌ Retry fail → {chat_id}: {e2}")
-            except TimedOut:
-                logger.error(f"❌ Timeout → {chat_id}")
-            except Exception as e:
-                logger.error(f"❌ Failed → {chat_id}: {e}")
+                    logger.info(
+                        f"✅ Posted → {chat_id}: {job.get('title', 'N/A')} "
+                        f"[{job.get('category', 'other')}]"
+                    )
+                except RetryAfter as e:
+                    logger.warning(f"⏳ Flood control {chat_id}: {e.retry_after}s ({attempt}/{attempts})")
+                    TELEGRAM_LIMITER.flood_wait(chat_id, e.retry_after)
+                    if attempt < attempts:
+                        await asyncio.sleep(e.retry_after)
+                        continue
+                except TimedOut:
+                    logger.error(f"❌ Timeout → {chat_id}")
+                except Exception as e:
+                    logger.error(f"❌ Failed → {chat_id}: {e}")
+                break
         return any_ok
 
 # ==================== MAIN LOOP ====================
@@ -3788,9 +4663,18 @@ async def main():
     # Initialize database
     db = init_database()
     run_hash_migration(db)
+    logger.info(f"🗂️ Dedup cache: {db.warm_hash_cache()} хэшей загружено")
     
     # Setup Telegram bot (job-queue optional for digests)
     builder = Application.builder().token(Config.TELEGRAM_BOT_TOKEN)
+    if RATE_LIMITER_AVAILABLE:
+        # Paces every Bot API call (commands too) and retries 429 after retry_after
+        builder = builder.rate_limiter(AIORateLimiter(
+            overall_max_rate=Config.TELEGRAM_GLOBAL_MSGS_PER_SEC,
+            group_max_rate=Config.TELEGRAM_CHAT_MSGS_PER_MIN,
+            max_retries=Config.TELEGRAM_FLOOD_RETRIES,
+        ))
+        logger.info("🚦 AIORateLimiter включён")
     try:
         application = builder.build()
     except Exception:
@@ -3893,17 +4777,24 @@ async def main():
     
     logger.info("✅ Telegram bot started with admin commands")
     
+    # Main collection loop: a dedicated pool (fetchers never queue behind unrelated
+    # run_in_executor users) sized like the FETCH_CONCURRENCY semaphore in front of it
+    api_fetch_functions = job_bot.api_fetch_functions
+    fetch_pool = ThreadPoolExecutor(
+        max_workers=max(1, min(len(api_fetch_functions), Config.FETCH_CONCURRENCY)),
+        thread_name_prefix='fetch',
+    )
+
     # Setup graceful shutdown (Unix only — Windows ProactorEventLoop has no add_signal_handler)
     loop = asyncio.get_running_loop()
     try:
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, lambda s=sig: asyncio.create_task(shutdown(s, application, db)))
+            loop.add_signal_handler(
+                sig, lambda s=sig: asyncio.create_task(shutdown(s, application, db, fetch_pool))
+            )
     except (NotImplementedError, RuntimeError) as e:
         logger.warning(f"Signal handlers not available on this platform: {e}")
     
-    # Main collection loop
-    api_fetch_functions = get_api_fetch_functions()
-    
     while True:
         try:
             if job_bot.is_paused:
@@ -3912,59 +4803,35 @@ async def main():
                 continue
             
             logger.info("🔄 Starting job collection cycle...")
-            all_jobs = []
-            
-            # Fetch from API sources
-            for fetch_func, source_name in api_fetch_functions:
-                jobs = await loop.run_in_executor(
-                    None, safe_fetch_with_retry, fetch_func, source_name
-                )
-                all_jobs.extend(jobs)
-                logger.info(f"📥 Fetched {len(jobs)} jobs from {source_name}")
             
-            # Fetch from Telegram channels
-            if Config.ENABLE_TELEGRAM_CHANNELS:
-                tg_jobs = await fetch_telegram_channels()
-                all_jobs.extend(tg_jobs)
+            # Fetch API sources (executor threads) and Telegram channels (Telethon,
+            # on the loop) at the same time — both are network-bound
+            all_jobs, tg_jobs = await asyncio.gather(
+                fetch_all_api_sources(api_fetch_functions, executor=fetch_pool),
+                fetch_telegram_channels(),
+            )
+            all_jobs.extend(tg_jobs)
             
-            logger.info(f"📊 Total jobs fetched: {len(all_jobs)}")
+            fetched_count = len(all_jobs)
+            logger.info(f"📊 Total jobs fetched: {fetched_count}")
             
-            # Filter, classify and process
-            classified_jobs = []
-            for job in all_jobs:
-                if GROWTH_UTILS_AVAILABLE:
-                    normalize_job_title_company(job)
-                if not is_suitable_job(job):
-                    continue
-                
-                # Classify level
-                level = classify_job_level(job)
-                if level:
-                    job['level'] = level
-                else:
-                    continue
-                
-                # Auto-classify category
-                category = auto_classify_category(job)
-                job['category'] = category
-
-                if GROWTH_UTILS_AVAILABLE:
-                    enrich_job_salary_fields(job)
-                    if not passes_min_salary(job, Config.GLOBAL_MIN_SALARY_USD):
-                        continue
-                    if not passes_channel_tracks(job, Config.CHANNEL_TRACKS):
-                        continue
-                
-                classified_jobs.append(job)
+            # Filter, classify and hash in one pass
+            prepare_stats: Dict[str, int] = {}
+            classified_jobs = prepare_candidates(all_jobs, stats=prepare_stats)
             
-            logger.info(f"🎯 Suitable Junior/Middle jobs: {len(classified_jobs)}")
+            logger.info(
+                f"🎯 Suitable Junior/Middle jobs: {len(classified_jobs)} "
+                f"(cross-listed copies collapsed: {prepare_stats['cross_listed']})"
+            )
             
             # Deduplicate (exact + fuzzy) then diversify by source
             publish_candidates = []
             duplicate_count = 0
+            purge_expired_jobs(db)
             recent_fps = db.recent_fingerprints(Config.FUZZY_DEDUP_LOOKBACK)
+            known_hashes = db.get_existing_hashes([job['hash'] for job in classified_jobs])
             for job in classified_jobs:
-                if is_duplicate_job(job, db, recent_fps=recent_fps):
+                if is_duplicate_job(job, db, recent_fps=recent_fps, known_hashes=known_hashes):
                     duplicate_count += 1
                     continue
                 publish_candidates.append(job)
@@ -3976,8 +4843,9 @@ async def main():
                     publish_candidates, Config.MAX_POSTS_PER_CYCLE
                 )
             else:
-                publish_candidates.sort(key=job_quality_score, reverse=True)
-                selected_jobs = publish_candidates[:Config.MAX_POSTS_PER_CYCLE]
+                selected_jobs = heapq.nlargest(
+                    Config.MAX_POSTS_PER_CYCLE, publish_candidates, key=job_quality_score
+                )
 
             logger.info(
                 f"🎯 Отобрано {len(selected_jobs)}/{len(publish_candidates)} "
@@ -3988,18 +4856,17 @@ async def main():
             posted_count = 0
             failed_count = 0
             posted_jobs: List[Dict] = []
-            for i, job in enumerate(selected_jobs):
-                # Telegram flood control: ~20 msg/min per chat safety pause
-                if i > 0 and i % 20 == 0:
-                    logger.info("⏳ Rate-limit safety pause: 60s after 20 messages")
-                    await asyncio.sleep(60)
-                if await job_bot.post_job(job):
-                    register_posted_job(job, db)
-                    posted_count += 1
-                    posted_jobs.append(job)
-                    await asyncio.sleep(DELAYS['between_posts'])
-                else:
-                    failed_count += 1
+            try:
+                # Pacing is done per send by TELEGRAM_LIMITER (global + per-chat buckets)
+                for job in selected_jobs:
+                    if await job_bot.post_job(job):
+                        posted_count += 1
+                        posted_jobs.append(job)
+                    else:
+                        failed_count += 1
+            finally:
+                # One batched insert per cycle, even if posting was interrupted
+                register_posted_jobs(posted_jobs, db)
             
             logger.info(
                 f"✅ Posted {posted_count} new jobs to channel "
@@ -4018,15 +4885,27 @@ async def main():
             logger.info(f"⏳ Waiting {Config.CHECK_INTERVAL//60} minutes before next cycle...")
             await asyncio.sleep(Config.CHECK_INTERVAL)
             
+        except (NetworkError, requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # Flaky Bot API / upstream connection (TimedOut included): retry the cycle soon
+            logger.warning(f"🌐 Network error in main loop ({type(e).__name__}): {e}")
+            await asyncio.sleep(DELAYS['after_network_error'])
         except Exception as e:
-            logger.error(f"❌ Error in main loop: {e}", exc_info=True)
-            await asyncio.sleep(300)
+            if is_sqlite_busy(e):
+                # busy_timeout ran out behind another writer: the lock is usually gone within seconds
+                logger.warning(f"🔒 SQLite busy in main loop: {e}")
+                await asyncio.sleep(DELAYS['after_db_locked'])
+                continue
+            logger.error(f"❌ Error in main loop ({type(e).__name__}): {e}", exc_info=True)
+            await asyncio.sleep(DELAYS['after_loop_error'])
 
 
-async def shutdown(signal, application, db):
+async def shutdown(signal, application, db, fetch_pool: Optional[ThreadPoolExecutor] = None):
     """Graceful shutdown handler"""
     logger.info(f"🛑 Received exit signal {signal.name}")
     
+    if fetch_pool is not None:
+        # Don't wait for in-flight HTTP requests; queued fetches are dropped
+        fetch_pool.shutdown(wait=False, cancel_futures=True)
     await application.stop()
     await application.shutdown()
     db.close()
@@ -7,7 +7,7 @@ from typing import Dict, Optional, List, Set
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryWeights:
     """Веса для определения категории"""
     name: str
@@ -17,6 +17,13 @@ from datetime import datetime, timezone
 from typing import Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json via requests
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +40,31 @@ def _headers() -> Dict[str, str]:
     }
 
 
+def _build_session() -> requests.Session:
+    """Keep-alive session shared by all extra sources (one TLS handshake per host)."""
+    session = requests.Session()
+    session.headers.update(_headers())
+    # Retry connection setup only; callers already handle HTTP errors per source
+    retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
+def _json(resp: requests.Response):
+    """Decode a JSON response body (orjson when installed, 3-5x faster on big feeds)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            pass  # non-UTF-8 / non-strict body — let requests handle it
+    return resp.json()
+
+
 def _strip_html(text: str) -> str:
     if not text:
         return ""
@@ -75,14 +107,13 @@ def fetch_4dayweek(max_pages: int = 3, limit: int = 50) -> List[Dict]:
                 "category": "engineering,product,design,data,devops,security,qa",
                 "sort": "date",
             }
-            resp = requests.get(
+            resp = _SESSION.get(
                 "https://4dayweek.io/api/v2/jobs",
                 params=params,
-                headers=_headers(),
                 timeout=25,
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = _json(resp)
             items = data.get("data") or []
             if not items:
                 break
@@ -174,14 +205,13 @@ def fetch_themuse(max_pages: int = 3) -> List[Dict]:
             for lv in levels:
                 params.append(("level", lv))
 
-            resp = requests.get(
+            resp = _SESSION.get(
                 "https://www.themuse.com/api/public/jobs",
                 params=params,
-                headers=_headers(),
                 timeout=25,
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = _json(resp)
             results = data.get("results") or []
             if not results:
                 break
@@ -283,9 +313,9 @@ def fetch_remoteok_dev() -> List[Dict]:
     try:
         for cat, url in REMOTEOK_CATEGORY_FEEDS:
             try:
-                resp = requests.get(url, headers=_headers(), timeout=25)
+                resp = _SESSION.get(url, timeout=25)
                 resp.raise_for_status()
-                batch = _parse_remoteok_json(resp.json(), source_label="RemoteOK Dev")
+                batch = _parse_remoteok_json(_json(resp), source_label="RemoteOK Dev")
                 for j in batch:
                     key = (j.get("url") or "") + "|" + (j.get("title") or "")
                     if key in seen_urls:
@@ -321,13 +351,12 @@ def fetch_working_nomads() -> List[Dict]:
         "marketing",  # filtered later by IT title signals if needed
     }
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             "https://www.workingnomads.com/api/exposed_jobs/",
-            headers=_headers(),
             timeout=25,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _json(resp)
         if not isinstance(data, list):
             return []
         jobs: List[Dict] = []
@@ -415,7 +444,7 @@ def fetch_rss_jobs(feeds: Optional[List[Tuple[str, str, bool]]] = None, limit_pe
     all_jobs: List[Dict] = []
     for name, url, force_remote in feeds:
         try:
-            resp = requests.get(url, headers=_headers(), timeout=25)
+            resp = _SESSION.get(url, timeout=25)
             resp.raise_for_status()
             root = ET.fromstring(_prepare_rss_xml(resp.content))
             # RSS 2.0 items (after namespace strip)
@@ -44,8 +44,12 @@ CATEGORY_NAMES_RU = {
     'other': 'Другое',
 }
 
+# Спецсимволы MarkdownV2: \ _ * [ ] ( ) ~ ` > # + - = | { } . !
+_MARKDOWN_V2_SPECIAL_CHARS = r'\_*[]()~`>#+-=|{}.!'
+_MARKDOWN_V2_SPECIAL_RE = re.compile('([' + re.escape(_MARKDOWN_V2_SPECIAL_CHARS) + '])')
 
-@dataclass
+
+@dataclass(slots=True)
 class FormattedMessage:
     """Структура отформатированного сообщения"""
     text: str
@@ -72,8 +76,7 @@ class JobMessageFormatter:
         
         # Экранируем все спецсимволы MarkdownV2 в один проход через regex.
         # Обратный слэш экранируется первым, чтобы избежать двойного экранирования.
-        escape_chars = r'\_*[]()~`>#+-=|{}.!'
-        return re.sub(f'([{re.escape(escape_chars)}])', r'\\\1', text)
+        return _MARKDOWN_V2_SPECIAL_RE.sub(r'\\\1', text)
     
     def _escape_url(self, url: str) -> str:
         """Экранирование URL для MarkdownV2"""
@@ -494,7 +494,7 @@ LOCATION_PATTERNS = [
     r'(?:remote|удаленно|удалённо)[\s]*(?:из|from)?[\s:]*(\S[^\n]+)',
 ]
 
-TECH_STACK_KEYWORDS = [
+TECH_STACK_KEYWORDS = (
     'python', 'javascript', 'typescript', 'java', 'c++', 'c#', 'go', 'golang', 'rust',
     'php', 'ruby', 'swift', 'kotlin', 'scala', 'perl', 'r', 'matlab',
     'react', 'vue', 'angular', 'svelte', 'next.js', 'nuxt', 'django', 'flask',
@@ -508,7 +508,13 @@ TECH_STACK_KEYWORDS = [
     'selenium', 'cypress', 'playwright', 'junit', 'pytest', 'jest',
     'linux', 'ubuntu', 'nginx', 'apache', 'kafka', 'rabbitmq',
     'react native', 'flutter', 'ios', 'android', 'mobile',
-]
+)
+
+# (паттерн с границами слов, отображаемое имя) — компилируются один раз при загрузке
+TECH_STACK_PATTERNS = tuple(
+    (re.compile(r'\b' + re.escape(tech) + r'\b'), tech.title() if tech != tech.upper() else tech)
+    for tech in TECH_STACK_KEYWORDS
+)
 
 LEVEL_KEYWORDS = {
     'junior': ['junior', 'jr', 'jr.', 'entry level', 'entry-level', 'начинающий', 'начальный', 'без опыта'],
@@ -516,17 +522,17 @@ LEVEL_KEYWORDS = {
     'senior': ['senior', 'sr', 'sr.', 'lead', 'principal', 'staff', 'architect', 'старший', 'ведущий'],
 }
 
-RESUME_BLOCK_SIGNALS = [
+RESUME_BLOCK_SIGNALS = (
     '#резюме', '#resume', '#cv', 'резюме', 'curriculum vitae',
     'зарплатные ожидания', 'salary expectations', 'ожидания по зарплате',
     'формат работы:', 'о себе:', 'ищу работу', 'в поиске работы',
     'open to work', 'looking for a job', 'looking for work',
     'years of experience', 'года опыта', 'лет опыта', 'мой стек',
     'мой опыт', 'готов к', 'рассматриваю предложения'
-]
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedJob:
     """Структура распарсенной вакансии"""
     title: str
@@ -708,11 +714,10 @@ class TelegramJobParser:
         text_lower = text.lower()
         found_tech = []
         
-        for tech in TECH_STACK_KEYWORDS:
+        for pattern, tech_name in TECH_STACK_PATTERNS:
             # Ищем слово как отдельное (с границами слов)
-            pattern = r'\b' + re.escape(tech.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_tech.append(tech.title() if tech != tech.upper() else tech)
+            if pattern.search(text_lower):
+                found_tech.append(tech_name)
         
         return list(set(found_tech))[:8]  # Максимум 8 технологий
     
@@ -0,0 +1,774 @@
+"""Unit tests for channel_bot helpers (no Telegram token required)."""
+import asyncio
+import io
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from unittest import mock
+
+import requests
+
+os.environ.setdefault("DISABLE_FILE_LOG", "true")
+
+from channel_bot import (
+    GROWTH_UTILS_AVAILABLE,
+    DatabaseConnection,
+    HostLimitedAdapter,
+    JobBot,
+    TelegramSendLimiter,
+    TokenBucket,
+    TELEGRAM_MESSAGE_LIMIT,
+    extract_skills,
+    fetch_api_sources_within_budget,
+    fetch_jobs_conditional,
+    format_job_message_legacy,
+    format_salary,
+    generate_job_hash,
+    is_sqlite_busy,
+    prepare_candidates,
+    purge_expired_jobs,
+    register_posted_jobs,
+    run_hash_migration,
+    truncate_html,
+)
+
+
+def make_job(title="Junior Python Developer", url="https://jobs.example/1", **extra):
+    job = {
+        "title": title,
+        "company": "Acme",
+        "url": url,
+        "description": "python django",
+        "source": "Remotive",
+        "location": "Remote",
+    }
+    job.update(extra)
+    return job
+
+
+def open_temp_db(test):
+    """Fresh DatabaseConnection in a temp dir, closed and removed after the test."""
+    tmp = tempfile.TemporaryDirectory()
+    test.addCleanup(tmp.cleanup)
+    db = DatabaseConnection(os.path.join(tmp.name, "jobs.db"))
+    test.addCleanup(db.conn.close)
+    return db
+
+
+def days_ago(days):
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class ExtractSkillsTests(unittest.TestCase):
+    def test_common_spellings_map_to_canonical_names(self):
+        job = {
+            "title": "Frontend Dev",
+            "description": "Golang, HTML5, CSS3, ReactJS and NodeJS; also node.js",
+        }
+        self.assertEqual(extract_skills(job), ["CSS", "Go", "HTML", "Node.js", "React"])
+
+    def test_whole_words_only(self):
+        job = {"title": "Engineer", "description": "Google cloud and JavaScript"}
+        self.assertEqual(extract_skills(job), ["JavaScript"])
+
+
+class FormatSalaryTests(unittest.TestCase):
+    def test_range_and_single_bounds(self):
+        self.assertEqual(format_salary(1000, 2000.4, "USD", "$"), "$1,000-$2,000 USD")
+        self.assertEqual(format_salary("150 000", None, "RUB"), "от 150,000 RUB")
+        self.assertEqual(format_salary(None, 500, symbol="$"), "до $500")
+
+    def test_zero_or_negative_bounds_are_missing(self):
+        self.assertEqual(format_salary(5, -1, symbol="$"), "от $5")
+        self.assertEqual(format_salary(0, 3000, symbol="$"), "до $3,000")
+        self.assertEqual(format_salary("0", 0, "RUB"), "Не указана")
+
+
+class TruncateHtmlTests(unittest.TestCase):
+    def test_never_splits_tags_or_entities(self):
+        self.assertEqual(truncate_html("<b>Hello &amp; world</b>", 12), "<b>Hello</b>")
+        self.assertEqual(truncate_html('ab <a href="x">link</a>', 8), "ab ")
+        self.assertEqual(truncate_html("a &amp; b", 6), "a ")
+        self.assertEqual(truncate_html("R&D team", 6), "R&D te")  # a bare & is not an entity
+        self.assertEqual(truncate_html("fits", 4), "fits")
+
+    def assert_valid_post(self, text):
+        self.assertLessEqual(len(text), TELEGRAM_MESSAGE_LIMIT)
+        for tag in ("b", "i", "a"):
+            self.assertEqual(text.count(f"<{tag}>") + text.count(f"<{tag} "), text.count(f"</{tag}>"), tag)
+        stripped = re.sub(r"<[^>]*>", "", text)
+        self.assertNotIn("<", stripped)
+        self.assertNotIn(">", stripped)
+        self.assertIsNone(re.search(r"&#?\w*(?![\w;])", stripped.replace("R&D", "")))
+
+    def test_oversized_description_is_cut_at_a_safe_boundary(self):
+        for offset in range(12):  # land the cut on every position within an entity
+            job = make_job(description="x" * offset + "R&D &amp; QA &lt;team&gt; " * 400, level="Junior")
+            with mock.patch("channel_bot.extract_description", side_effect=lambda job: job["description"]):
+                text = format_job_message_legacy(job)
+            self.assert_valid_post(text)
+            self.assertIn("Откликнуться на вакансию</a>", text)
+            self.assertTrue(text.endswith("📌 Источник: Remotive"))
+
+    def test_oversized_title_falls_back_to_a_balanced_cut(self):
+        job = make_job(title="Junior <Python> & Go " * 300)
+        text = format_job_message_legacy(job)
+        self.assert_valid_post(text)
+        self.assertTrue(text.endswith("<i>(сообщение сокращено)</i>"))
+
+
+class TokenBucketTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        patcher = mock.patch("channel_bot.time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_one_slot_per_interval(self):
+        bucket = TokenBucket(3, 3.0)  # burst of 3, then one send per second
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+        self.assertAlmostEqual(bucket.reserve(), 2.0)
+
+    def test_refills_while_idle(self):
+        bucket = TokenBucket(3, 3.0)
+        for _ in range(5):
+            bucket.reserve()
+        self.now += 10.0
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_hold_blocks_for_flood_wait(self):
+        bucket = TokenBucket(20, 60.0)
+        bucket.hold(5)
+        self.assertAlmostEqual(bucket.reserve(), 5.0)
+        self.now += 5.0
+        self.assertAlmostEqual(bucket.reserve(), 3.0)  # hold drained the burst too
+
+    def test_limiter_waits_for_slower_bucket(self):
+        limiter = TelegramSendLimiter(global_per_sec=30, chat_per_min=20)
+        with mock.patch("channel_bot.asyncio.sleep", new_callable=mock.AsyncMock) as sleep:
+            for _ in range(21):
+                asyncio.run(limiter.wait("-100"))
+            asyncio.run(limiter.wait("-200"))
+        # 20 free per chat, the 21st waits one 3 s chat interval; other chats are independent
+        self.assertEqual(sleep.await_count, 1)
+        self.assertAlmostEqual(sleep.await_args.args[0], 3.0)
+
+
+class TransactionTests(unittest.TestCase):
+    def setUp(self):
+        self.db = open_temp_db(self)
+
+    def titles(self):
+        # a second connection only sees committed rows
+        other = sqlite3.connect(self.db.db_path)
+        try:
+            return sorted(row[0] for row in other.execute("SELECT title FROM posted_jobs"))
+        finally:
+            other.close()
+
+    def insert(self, job_hash):
+        self.db.execute("INSERT INTO posted_jobs (hash, title, company) VALUES (?, ?, 'Acme')", (job_hash, job_hash))
+
+    def test_nested_blocks_commit_once_at_the_outermost_exit(self):
+        with self.db.transaction():
+            self.insert("a")
+            with self.db.transaction():
+                self.insert("b")
+            self.assertEqual(self.titles(), [])  # inner exit and execute() defer the commit
+        self.assertEqual(self.titles(), ["a", "b"])
+        self.assertFalse(self.db.conn.in_transaction)
+
+    def test_exception_rolls_back_the_whole_block(self):
+        self.insert("kept")
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.insert("a")
+                with self.db.transaction():
+                    self.insert("b")
+                    raise RuntimeError("boom")
+        self.assertEqual(self.titles(), ["kept"])
+        self.assertEqual(self.db._tx_depth, 0)
+        with self.db.transaction():  # usable again after the rollback
+            self.insert("c")
+        self.assertEqual(self.titles(), ["c", "kept"])
+
+    def test_busy_timeout_is_short(self):
+        self.assertEqual(self.db.fetchone("PRAGMA busy_timeout")[0], 5000)
+
+
+class FetchBudgetTests(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)  # let the stuck worker thread exit
+        patcher = mock.patch("channel_bot.safe_fetch_with_retry", lambda fetch, name, retries: fetch())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def stuck(self):
+        self.release.wait(10)
+        return [{"title": "late"}]
+
+    def test_slow_source_is_skipped_and_call_returns_at_budget(self):
+        results = []
+        started = time.monotonic()
+        jobs = asyncio.run(fetch_api_sources_within_budget(
+            [(self.stuck, "Slow"), (lambda: [{"title": "ok"}], "Fast")], timeout=0.2, source_results=results,
+        ))
+        # asyncio.run() returned without joining the stuck thread
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(jobs, [{"title": "ok"}])
+        self.assertEqual(results, [
+            {"source": "Slow", "fetched": 0, "timed_out": True},
+            {"source": "Fast", "fetched": 1},
+        ])
+
+    def test_queued_sources_wait_for_a_free_slot(self):
+        results = []
+        with mock.patch("channel_bot.Config.FETCH_CONCURRENCY", 1):
+            jobs = asyncio.run(fetch_api_sources_within_budget(
+                [(self.stuck, "Slow"), (lambda: [{"title": "ok"}], "Queued")], timeout=0.2, source_results=results,
+            ))
+        self.assertEqual(jobs, [])
+        self.assertTrue(all(result["timed_out"] for result in results))
+
+
+class HostLimitedAdapterTests(unittest.TestCase):
+    def send(self, stream):
+        adapter = HostLimitedAdapter(1)
+        slot = adapter._slot("api.example")
+        reads = []
+
+        class Body(io.BytesIO):
+            def read(self, *args):
+                free = slot.acquire(blocking=False)
+                if free:
+                    slot.release()
+                reads.append(not free)  # True: read while send() still held the slot
+                return super().read(*args)
+
+        def fake_send(_adapter, request, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.raw = Body(b'{"jobs": []}')
+            return response
+
+        request = requests.Request("GET", "https://api.example/jobs").prepare()
+        with mock.patch("channel_bot.HTTPAdapter.send", fake_send):
+            response = adapter.send(request, stream=stream)
+        return response, reads, slot
+
+    def test_body_is_read_while_the_host_slot_is_held(self):
+        response, reads, slot = self.send(stream=False)
+        self.assertTrue(reads)
+        self.assertTrue(all(reads))
+        self.assertEqual(response.json(), {"jobs": []})
+        self.assertTrue(slot.acquire(blocking=False))  # released afterwards
+
+    def test_streamed_body_is_left_to_the_caller(self):
+        response, reads, _ = self.send(stream=True)
+        self.assertEqual(reads, [])
+        self.assertEqual(response.content, b'{"jobs": []}')
+
+
+def http_response(status, body=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class ConditionalFetchTests(unittest.TestCase):
+    url = "https://feed.example/jobs"
+
+    def setUp(self):
+        patcher = mock.patch.dict("channel_bot._CONDITIONAL_CACHE", clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def parse(data):
+        return [{"title": job["title"]} for job in data["jobs"]]
+
+    def test_304_reuses_cached_jobs_and_sends_validators(self):
+        first = http_response(200, b'{"jobs": [{"title": "Junior QA"}]}',
+                              {"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 10:00:00 GMT"})
+        with mock.patch("channel_bot.HTTP_SESSION") as session:
+            session.get.side_effect = [first, http_response(304)]
+            fresh = fetch_jobs_conditional(self.url, self.parse)
+            fresh[0]["level"] = "Junior"  # the pipeline mutates jobs; the cache must not see it
+            cached = fetch_jobs_conditional(self.url, self.parse)
+
+        self.assertEqual(cached, [{"title": "Junior QA"}])
+        self.assertEqual(session.get.call_args_list[0].kwargs["headers"], {})
+        self.assertEqual(session.get.call_args_list[1].kwargs["headers"], {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 01 Oct 2025 10:00:00 GMT",
+        })
+
+    def test_feed_without_validators_is_not_cached(self):
+        with mock.patch("channel_bot.HTTP_SESSION") as session:
+            session.get.return_value = http_response(200, b'{"jobs": []}')
+            fetch_jobs_conditional(self.url, self.parse)
+            fetch_jobs_conditional(self.url, self.parse)
+        self.assertEqual(session.get.call_args.kwargs["headers"], {})
+
+
+class LastCommandTests(unittest.TestCase):
+    def setUp(self):
+        self.db = open_temp_db(self)
+        rows = [
+            ("Remotive", "Junior"), ("Greenhouse:gitlab", "Middle"), ("hh_ru", "Junior"),
+            ("hhXru", "Middle"), ("100%Remote", "Junior"), ("100xRemote", "Junior"),
+            ("Adzuna", "Junior"), ("Adzuna", "Middle"),
+        ]
+        self.db.executemany(
+            "INSERT INTO posted_jobs (hash, title, company, level, source, posted_at) VALUES (?, ?, ?, ?, ?, ?)",
+            [(f"h{i}", f"Job {i} from {source}", "Acme", level, source, days_ago(i))
+             for i, (source, level) in enumerate(rows)],
+        )
+        self.bot = JobBot(None, self.db)
+        self.bot.formatter = None
+        patcher = mock.patch("channel_bot.Config.ADMIN_USER_ID", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def last(self, *args):
+        update = mock.MagicMock()
+        update.message.reply_text = mock.AsyncMock()
+        asyncio.run(self.bot.cmd_last(update, mock.MagicMock(args=list(args))))
+        text = update.message.reply_text.await_args.args[0]
+        return [line[2:].split(" from ")[0] for line in text.splitlines() if line.startswith("• ")]
+
+    def test_defaults_to_five_newest(self):
+        self.assertEqual(self.last(), ["Job 0", "Job 1", "Job 2", "Job 3", "Job 4"])
+
+    def test_bare_count_is_clamped(self):
+        self.assertEqual(self.last("2"), ["Job 0", "Job 1"])
+        self.assertEqual(len(self.last("500")), 8)  # capped at 20, only 8 rows exist
+        self.assertEqual(self.last("0"), ["Job 0"])
+
+    def test_source_is_matched_literally_with_sub_sources(self):
+        self.assertEqual(self.last("hh_ru"), ["Job 2"])
+        self.assertEqual(self.last("100%Remote"), ["Job 4"])
+        self.assertEqual(self.last("3", "greenhouse"), ["Job 1"])
+        self.assertEqual(self.last("1", "adzuna"), ["Job 6"])
+
+    def test_level_filter(self):
+        self.assertEqual(self.last("middle"), ["Job 1", "Job 3", "Job 7"])
+        self.assertEqual(self.last("2", "Junior"), ["Job 0", "Job 2"])
+
+    def test_no_match_replies_empty(self):
+        update = mock.MagicMock()
+        update.message.reply_text = mock.AsyncMock()
+        asyncio.run(self.bot.cmd_last(update, mock.MagicMock(args=["%"])))
+        update.message.reply_text.assert_awaited_once_with("📭 Нет опубликованных вакансий")
+
+
+class PostedJobsMigrationTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "jobs.db")
+        conn = sqlite3.connect(self.path)
+        conn.execute("""
+            CREATE TABLE posted_jobs (
+                hash TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                company TEXT NOT NULL,
+                level TEXT,
+                url TEXT,
+                source TEXT,
+                category TEXT DEFAULT 'other',
+                posted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO posted_jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                ("h1", "Junior Python", "Acme", "Junior", "https://a/1", "Remotive", "development",
+                 "2024-03-01 10:00:00"),
+                ("h2", "QA Engineer", "Beta", "Middle", "https://b/2", "Adzuna", "qa",
+                 "2024-03-02 11:00:00"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+    def open_db(self):
+        db = DatabaseConnection(self.path)
+        self.addCleanup(db.conn.close)
+        return db
+
+    def rows(self, db):
+        return db.fetchall(
+            "SELECT hash, title, company, level, url, source, category, posted_at, fingerprint "
+            "FROM posted_jobs ORDER BY hash"
+        )
+
+    def schema(self, db):
+        return db.fetchone("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'posted_jobs'")[0]
+
+    def test_rebuild_preserves_rows_and_is_idempotent(self):
+        expected = [
+            ("h1", "Junior Python", "Acme", "Junior", "https://a/1", "Remotive", "development",
+             "2024-03-01 10:00:00", ""),
+            ("h2", "QA Engineer", "Beta", "Middle", "https://b/2", "Adzuna", "qa",
+             "2024-03-02 11:00:00", ""),
+        ]
+        db = self.open_db()
+        self.assertIn("WITHOUT ROWID", self.schema(db).upper())
+        self.assertEqual(self.rows(db), expected)
+        db.conn.close()
+
+        db = self.open_db()  # second start: already migrated, nothing changes
+        self.assertIn("WITHOUT ROWID", self.schema(db).upper())
+        self.assertEqual(self.rows(db), expected)
+        self.assertIsNone(db.fetchone("SELECT name FROM sqlite_master WHERE name = 'posted_jobs_new'"))
+
+
+    def test_hash_migration_keeps_rows_payloads_and_favorites(self):
+        db = self.open_db()
+        db.execute(
+            "INSERT INTO posted_jobs (hash, title, company, url, category, posted_at) VALUES (?, ?, ?, ?, ?, ?)",
+            ("h3", "Junior Python", "Acme", "https://a/1?utm_source=tg", "development", "2024-03-03 09:00:00"),
+        )
+        db.executemany(
+            "INSERT INTO job_payloads (hash, payload) VALUES (?, ?)",
+            [("h1", '{"title": "Junior Python"}'), ("h2", '{"title": "QA Engineer"}'), ("h3", '{"dup": true}')],
+        )
+        db.executemany(
+            "INSERT INTO user_favorites (user_id, job_hash) VALUES (?, ?)",
+            [(7, "h1"), (7, "h3"), (8, "h2")],
+        )
+        db.execute("DELETE FROM meta WHERE key = 'hash_migration_done'")
+
+        self.assertTrue(run_hash_migration(db))
+        new_h1 = generate_job_hash({"url": "https://a/1"})
+        new_h2 = generate_job_hash({"url": "https://b/2"})
+        # h3 is a later copy of h1 (same normalized URL): the first post wins
+        self.assertEqual(
+            db.fetchall("SELECT hash, title, posted_at FROM posted_jobs ORDER BY posted_at"),
+            [(new_h1, "Junior Python", "2024-03-01 10:00:00"), (new_h2, "QA Engineer", "2024-03-02 11:00:00")],
+        )
+        self.assertEqual(
+            sorted(db.fetchall("SELECT hash, payload FROM job_payloads")),
+            sorted([(new_h1, '{"title": "Junior Python"}'), (new_h2, '{"title": "QA Engineer"}')]),
+        )
+        self.assertEqual(
+            sorted(db.fetchall("SELECT user_id, job_hash FROM user_favorites")),
+            sorted([(7, new_h1), (8, new_h2)]),
+        )
+
+        snapshot = [self.rows(db), db.fetchall("SELECT * FROM job_payloads ORDER BY hash")]
+        self.assertTrue(run_hash_migration(db))  # already done: no-op
+        self.assertEqual([self.rows(db), db.fetchall("SELECT * FROM job_payloads ORDER BY hash")], snapshot)
+
+
+class PrepareCandidatesTests(unittest.TestCase):
+    def test_sets_level_category_and_hash(self):
+        [job] = prepare_candidates([make_job()])
+        self.assertEqual(job["level"], "Junior")
+        self.assertEqual(job["category"], "development")
+        self.assertEqual(job["hash"], generate_job_hash(job))
+
+    def test_cross_listed_copies_collapse_and_are_counted(self):
+        stats = {}
+        jobs = [
+            make_job(url="https://a.example/1", source="A"),
+            make_job(url="https://b.example/2", source="B"),  # same title+company
+            make_job(title="Junior Go Developer", url="https://c.example/3", source="C"),
+        ]
+        result = prepare_candidates(jobs, stats=stats)
+        self.assertEqual([job["source"] for job in result], ["A", "C"])
+        self.assertEqual(stats, {"cross_listed": 1})
+
+    def test_rejected_copy_does_not_hide_passing_copy(self):
+        stats = {}
+        rejected = make_job(source="A", description="10+ years, staff level")
+        passing = make_job(source="B", url="https://jobs.example/2")
+        result = prepare_candidates([rejected, passing], stats=stats)
+        self.assertEqual([job["source"] for job in result], ["B"])
+        self.assertEqual(stats, {"cross_listed": 0})
+
+    @unittest.skipUnless(GROWTH_UTILS_AVAILABLE, "growth_utils not importable")
+    def test_salary_filter_runs_before_cross_listing_dedup(self):
+        low = make_job(source="A", salary_min=500, salary_max=500, currency="USD")
+        high = make_job(source="B", url="https://jobs.example/2", salary_min=2000, salary_max=2000, currency="USD")
+        with mock.patch("channel_bot.Config.GLOBAL_MIN_SALARY_USD", 1000):
+            result = prepare_candidates([low, high])
+        self.assertEqual([job["source"] for job in result], ["B"])
+
+    def test_in_cycle_duplicates_collapse_to_first_passing_copy(self):
+        stats = {}
+        jobs = [
+            make_job(url="https://a.example/1", source="A"),
+            # same normalized URL under another title: caught by the hash set
+            make_job(title="Junior Python Engineer", url="https://a.example/1?utm_source=x", source="B"),
+            make_job(url="https://c.example/1", source="C"),
+            make_job(title="Junior Go Developer", url="https://d.example/1", source="D"),
+        ]
+        result = prepare_candidates(jobs, stats=stats)
+        self.assertEqual([job["source"] for job in result], ["A", "D"])
+        self.assertEqual(len({job["hash"] for job in result}), 2)
+        self.assertEqual(stats, {"cross_listed": 2})
+
+
+class HashCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.db = open_temp_db(self)
+        self.db.executemany(
+            "INSERT INTO posted_jobs (hash, title, company, category, posted_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                ("old", "Junior Python", "Acme", "development", days_ago(40)),
+                ("mid", "QA Engineer", "Beta", "qa", days_ago(5)),
+                ("new", "Data Analyst", "Gamma", "data", days_ago(1)),
+            ],
+        )
+
+    def in_db(self, hashes):
+        rows = self.db.fetchall(
+            f"SELECT hash FROM posted_jobs WHERE hash IN ({','.join('?' * len(hashes))})", tuple(hashes)
+        )
+        return {row[0] for row in rows}
+
+    def test_warm_keeps_newest_hashes(self):
+        with mock.patch("channel_bot.Config.DEDUP_CACHE_SIZE", 2):
+            self.assertEqual(self.db.warm_hash_cache(), 2)
+        self.assertEqual(list(self.db._hash_cache), ["mid", "new"])
+
+    def test_hits_and_misses_agree_with_db(self):
+        self.db.warm_hash_cache()
+        probe = ["new", "mid", "old", "unknown", ""]
+        with mock.patch.object(self.db, "fetchall", wraps=self.db.fetchall) as fetchall:
+            self.assertEqual(self.db.get_existing_hashes(["new", "mid"]), {"new", "mid"})
+            fetchall.assert_not_called()  # both cached: no SQLite round-trip
+        self.db.reset_hash_cache()
+        self.assertEqual(self.db.get_existing_hashes(probe), self.in_db(probe))
+        self.assertEqual(set(self.db._hash_cache), {"new", "mid", "old"})  # misses fill the cache
+
+    def test_lru_evicts_least_recently_used(self):
+        with mock.patch("channel_bot.Config.DEDUP_CACHE_SIZE", 2):
+            self.db.get_existing_hashes(["old", "mid"])
+            self.db.get_existing_hashes(["old"])  # refresh "old"
+            self.db.get_existing_hashes(["new"])
+        self.assertEqual(list(self.db._hash_cache), ["old", "new"])
+        self.assertEqual(self.db.get_existing_hashes(["mid"]), {"mid"})  # evicted, still found in SQLite
+
+    def test_purge_evicts_expired_hashes(self):
+        self.db.warm_hash_cache()
+        self.db.purge_expired(retention_days=28)
+        self.assertNotIn("old", self.db._hash_cache)
+        probe = ["old", "mid", "new"]
+        self.assertEqual(self.db.get_existing_hashes(probe), self.in_db(probe))
+        self.assertEqual(self.in_db(probe), {"mid", "new"})
+
+
+class RegisterPostedJobsTests(unittest.TestCase):
+    def make_jobs(self):
+        return [
+            make_job(url="https://a.example/1", level="Junior", category="development"),
+            make_job(title="QA Engineer", company="Beta", url="https://b.example/2", level="Middle", category="qa"),
+        ]
+
+    def rows(self, db):
+        return db.fetchall(
+            "SELECT hash, title, company, level, url, source, category, fingerprint FROM posted_jobs ORDER BY hash"
+        )
+
+    def test_batch_insert_matches_one_by_one(self):
+        batch_db, single_db = open_temp_db(self), open_temp_db(self)
+        register_posted_jobs(self.make_jobs(), batch_db)
+        for job in self.make_jobs():
+            register_posted_jobs([job], single_db)
+        self.assertEqual(len(self.rows(batch_db)), 2)
+        self.assertEqual(self.rows(batch_db), self.rows(single_db))
+
+    def test_repeat_insert_is_a_no_op(self):
+        db = open_temp_db(self)
+        jobs = self.make_jobs()
+        register_posted_jobs(jobs, db)
+        before = db.fetchall("SELECT * FROM posted_jobs ORDER BY hash")
+        counts = db.posted_counts_by_category()
+        register_posted_jobs(self.make_jobs() + jobs, db)  # known hashes, and repeated within the batch
+        self.assertEqual(db.fetchall("SELECT * FROM posted_jobs ORDER BY hash"), before)
+        self.assertEqual(db.posted_counts_by_category(), counts)
+
+    def test_repeat_keeps_cached_posted_at_in_step_with_db(self):
+        db = open_temp_db(self)
+        jobs = self.make_jobs()
+        register_posted_jobs(jobs, db)
+        db.execute("UPDATE posted_jobs SET posted_at = ?", (days_ago(40),))
+        db.reset_hash_cache()
+        register_posted_jobs(self.make_jobs(), db)
+        stored = dict(db.fetchall("SELECT hash, posted_at FROM posted_jobs"))
+        self.assertEqual(dict(db._hash_cache), stored)
+        db.purge_expired(retention_days=28)  # so the purge evicts them with their rows
+        self.assertEqual(db.get_existing_hashes(list(stored)), set())
+
+    def test_registered_hashes_are_cached(self):
+        db = open_temp_db(self)
+        jobs = self.make_jobs()
+        register_posted_jobs(jobs, db)
+        hashes = [job["hash"] for job in jobs]  # _posted_job_row fills in the hash
+        self.assertEqual(hashes, [generate_job_hash(job) for job in jobs])
+        with mock.patch.object(db, "fetchall", wraps=db.fetchall) as fetchall:
+            self.assertEqual(db.get_existing_hashes(hashes), set(hashes))
+            fetchall.assert_not_called()
+
+        restarted = DatabaseConnection(db.db_path)  # cache is rebuilt from SQLite on startup
+        self.addCleanup(restarted.conn.close)
+        self.assertEqual(restarted.warm_hash_cache(), 2)
+        self.assertEqual(set(restarted._hash_cache), set(hashes))
+
+
+class PurgeExpiredTests(unittest.TestCase):
+    def setUp(self):
+        self.db = open_temp_db(self)
+        self.db.executemany(
+            "INSERT INTO posted_jobs (hash, title, company, category, posted_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                ("old-dev", "Junior Python", "Acme", "development", days_ago(40)),
+                ("old-qa", "QA Engineer", "Beta", "qa", days_ago(30)),
+                ("new-dev", "Junior Go", "Gamma", "development", days_ago(2)),
+            ],
+        )
+        self.db.executemany(
+            "INSERT INTO job_payloads (hash, payload, created_at) VALUES (?, ?, ?)",
+            [("old-dev", "{}", days_ago(40)), ("new-dev", "{}", days_ago(2))],
+        )
+
+    def hashes(self, table):
+        return {row[0] for row in self.db.fetchall(f"SELECT hash FROM {table}")}
+
+    def test_drops_only_rows_past_retention(self):
+        self.db.purge_expired(retention_days=28, payload_days=14)
+        self.assertEqual(self.hashes("posted_jobs"), {"new-dev"})
+        self.assertEqual(self.hashes("job_payloads"), {"new-dev"})
+
+    def test_updates_cache_and_counters(self):
+        self.db.warm_hash_cache()
+        self.assertEqual(self.db.posted_counts_by_category(), {"development": 2, "qa": 1})
+        self.db.purge_expired(retention_days=28)
+        self.assertEqual(set(self.db._hash_cache), {"new-dev"})
+        self.assertEqual(self.db.posted_counts_by_category(), {"development": 1})
+
+    def test_runs_at_most_once_per_interval(self):
+        with mock.patch("channel_bot.Config.DEDUP_RETENTION_DAYS", 28):
+            self.assertTrue(purge_expired_jobs(self.db))
+            marker = self.db.fetchone("SELECT value FROM meta WHERE key = 'last_purge_at'")[0]
+            self.db.execute(
+                "INSERT INTO posted_jobs (hash, title, company, posted_at) VALUES (?, ?, ?, ?)",
+                ("late", "Junior Java", "Delta", days_ago(60)),
+            )
+            self.assertFalse(purge_expired_jobs(self.db))  # same day: skipped
+            self.assertEqual(self.hashes("posted_jobs"), {"new-dev", "late"})
+            self.assertEqual(self.db.fetchone("SELECT value FROM meta WHERE key = 'last_purge_at'")[0], marker)
+
+            # the marker survives a restart, so a cold start does not purge again either
+            restarted = DatabaseConnection(self.db.db_path)
+            self.addCleanup(restarted.conn.close)
+            self.assertFalse(purge_expired_jobs(restarted))
+
+    def test_locked_database_leaves_purge_for_next_cycle(self):
+        self.db.conn.execute("PRAGMA busy_timeout=0")  # don't wait out the 5 s default
+        writer = sqlite3.connect(self.db.db_path)
+        self.addCleanup(writer.close)
+        writer.execute("BEGIN IMMEDIATE")
+        self.assertFalse(purge_expired_jobs(self.db))
+        self.assertIsNone(self.db.fetchone("SELECT value FROM meta WHERE key = 'last_purge_at'"))
+        writer.rollback()
+        self.assertTrue(purge_expired_jobs(self.db))
+        self.assertEqual(self.hashes("posted_jobs"), {"new-dev"})
+
+    def test_is_sqlite_busy(self):
+        self.assertTrue(is_sqlite_busy(sqlite3.OperationalError("database is locked")))
+        self.assertFalse(is_sqlite_busy(sqlite3.OperationalError("no such table: meta")))
+        self.assertFalse(is_sqlite_busy(RuntimeError("database is locked")))
+
+
+class CategoryCountTests(unittest.TestCase):
+    def table_counts(self, db):
+        return dict(db.fetchall("SELECT category, COUNT(*) FROM posted_jobs GROUP BY category"))
+
+    def test_counters_match_group_by_after_inserts_and_purge(self):
+        db = open_temp_db(self)
+        db.executemany(
+            "INSERT INTO posted_jobs (hash, title, company, category, posted_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                ("old-dev", "Junior Python", "Acme", "development", days_ago(40)),
+                ("old-qa", "QA Engineer", "Beta", "qa", days_ago(35)),
+                ("mid-qa", "QA Analyst", "Beta", "qa", days_ago(3)),
+            ],
+        )
+        self.assertEqual(db.posted_counts_by_category(), self.table_counts(db))  # loaded once
+
+        register_posted_jobs([
+            make_job(url="https://a/1", category="development"),
+            make_job(title="Data Analyst", url="https://d/1", category="data"),
+            make_job(title="Data Analyst", url="https://d/1", category="data"),  # repeat in batch
+        ], db)
+        self.assertEqual(db.posted_counts_by_category(), self.table_counts(db))
+
+        db.purge_expired(retention_days=28)
+        register_posted_jobs([make_job(title="Junior QA", url="https://q/1", category="qa")], db)
+        register_posted_jobs([make_job(url="https://a/1", category="development")], db)  # already stored
+        self.assertEqual(db.posted_counts_by_category(), self.table_counts(db))
+        self.assertEqual(db.posted_counts_by_category(), {"development": 1, "data": 1, "qa": 2})
+
+
+class StatusCommandTests(unittest.TestCase):
+    def setUp(self):
+        self.db = open_temp_db(self)
+        register_posted_jobs([make_job(category="development")], self.db)
+
+    def test_counts_are_read_off_the_event_loop(self):
+        bot = JobBot(None, self.db)
+        bot.formatter = None
+        update = mock.MagicMock()
+        update.message.reply_text = mock.AsyncMock()
+        threads = []
+        counts = self.db.posted_counts_by_category
+
+        def recording_counts():
+            threads.append(threading.get_ident())
+            return counts()
+
+        with mock.patch.object(self.db, "posted_counts_by_category", recording_counts), \
+                mock.patch("channel_bot.Config.ADMIN_USER_ID", 0):
+            asyncio.run(bot.cmd_status(update, mock.MagicMock()))
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.get_ident())
+        self.assertIn("1", update.message.reply_text.await_args.args[0])
+
+    def test_counts_wait_for_an_open_write_transaction(self):
+        self.db.reset_hash_cache()  # force the lazy GROUP BY
+        inserted, release = threading.Event(), threading.Event()
+
+        def writer():
+            with self.db.transaction():
+                register_posted_jobs([make_job(title="QA Engineer", url="https://q/1", category="qa")], self.db)
+                inserted.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        inserted.wait(5)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(self.db.posted_counts_by_category)
+            self.assertRaises(TimeoutError, future.result, timeout=0.1)  # blocked on the db lock
+            release.set()
+            self.assertEqual(future.result(timeout=5), {"development": 1, "qa": 1})
+        thread.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,6 +12,7 @@ from job_sources_extra import (
     fetch_working_nomads,
     get_extra_fetchers,
     run_fetcher,
+    _json,
     _parse_remoteok_json,
 )
 
@@ -69,6 +70,14 @@ class SourceHealthTests(unittest.TestCase):
         self.assertEqual(len(jobs), 1)
         self.assertEqual(jobs[0]["title"], "Junior Python Engineer")
 
+    def test_json_helper_decodes_body(self):
+        import requests
+
+        resp = requests.Response()
+        resp._content = '{"jobs": [{"title": "Junior QA", "salary": 1.5}]}'.encode("utf-8")
+        resp.encoding = "utf-8"
+        self.assertEqual(_json(resp), {"jobs": [{"title": "Junior QA", "salary": 1.5}]})
+
     def test_rss_feeds_no_dead_hosts(self):
         hosts = " ".join(u for _, u, _ in RSS_FEEDS)
         self.assertNotIn("nodejsjobslist.com", hosts)